@@ -93,6 +93,7 @@ config :logger, :default_formatter,
     :escalation_count,
     :negotiation_count,
     :module,
+    :signal_domain,
     :pid,
     :profile,
     :error_type,
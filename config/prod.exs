@@ -3,5 +3,19 @@ import Config
 # Do not print debug messages in production
 config :logger, level: :info
 
+# Keep logging off the caller's critical path under bursts. The default
+# handler already writes asynchronously; these thresholds let it stay async
+# for longer before switching to sync mode, then drop and flush rather than
+# blocking request processes on a slow stdout sink (journald, container pipes).
+config :logger, :default_handler,
+  config: [
+    sync_mode_qlen: 100,
+    drop_mode_qlen: 1_000,
+    flush_qlen: 5_000,
+    burst_limit_enable: true,
+    burst_limit_max_count: 2_000,
+    burst_limit_window_time: 1_000
+  ]
+
 # Runtime production configuration, including reading
 # of environment variables, is done on config/runtime.exs.
@@ -145,7 +145,7 @@ defmodule Synapse.Actions.GenerateCritique do
     case Application.get_env(:synapse, :req_llm_module) do
       nil ->
         # No override - use altar_ai if available
-        if altar_ai_available?() do
+        if ReqLLM.altar_ai_loaded?() do
           Altar.AI.Integrations.Synapse
         else
           ReqLLM
@@ -156,9 +156,4 @@ defmodule Synapse.Actions.GenerateCritique do
         module
     end
   end
-
-  defp altar_ai_available? do
-    Code.ensure_loaded?(Altar.AI.Integrations.Synapse) and
-      function_exported?(Altar.AI.Integrations.Synapse, :chat_completion, 2)
-  end
 end
@@ -4,6 +4,11 @@ defmodule Synapse.AgentRegistry do
 
   Provides a centralized way to track active agents and prevent duplicate
   spawning of the same agent instance.
+
+  When the registry is started under an atom name it mirrors its entries into a
+  read-optimized ETS table of the same name, so `lookup/2` is served without a
+  round trip through the registry process. Writes still go through the
+  GenServer, which keeps registration and monitoring serialized.
   """
 
   use GenServer
@@ -47,7 +52,19 @@ defmodule Synapse.AgentRegistry do
   Returns `{:ok, pid}` if found, `{:error, :not_found}` otherwise.
   """
   @spec lookup(GenServer.server(), agent_id()) :: {:ok, agent_pid()} | {:error, :not_found}
-  def lookup(registry \\ __MODULE__, agent_id) do
+  def lookup(registry \\ __MODULE__, agent_id)
+
+  def lookup(registry, agent_id) when is_atom(registry) do
+    case :ets.lookup(registry, agent_id) do
+      [{^agent_id, pid}] -> {:ok, pid}
+      [] -> {:error, :not_found}
+    end
+  rescue
+    # No table for this name (e.g. the registry is not running yet)
+    ArgumentError -> GenServer.call(registry, {:lookup, agent_id})
+  end
+
+  def lookup(registry, agent_id) do
     GenServer.call(registry, {:lookup, agent_id})
   end
 
@@ -83,12 +100,14 @@ defmodule Synapse.AgentRegistry do
   ## Server Callbacks
 
   @impl true
-  def init(_opts) do
+  def init(opts) do
     # agents: %{agent_id => pid}
     # monitors: %{monitor_ref => agent_id}
+    # table: ETS mirror of agents for lock-free lookups (named registries only)
     state = %{
       agents: %{},
-      monitors: %{}
+      monitors: %{},
+      table: init_table(Keyword.get(opts, :name, __MODULE__))
     }
 
     {:ok, state}
@@ -105,9 +124,8 @@ defmodule Synapse.AgentRegistry do
             ref = Process.monitor(pid)
 
             new_state = %{
-              state
-              | agents: Map.put(state.agents, agent_id, pid),
-                monitors: Map.put(state.monitors, ref, agent_id)
+              put_agent(state, agent_id, pid)
+              | monitors: Map.put(state.monitors, ref, agent_id)
             }
 
             Logger.debug("AgentRegistry: Spawned new agent",
@@ -128,7 +146,7 @@ defmodule Synapse.AgentRegistry do
           {:reply, {:ok, pid, false}, state}
         else
           # Stale entry, remove and retry
-          new_state = %{state | agents: Map.delete(state.agents, agent_id)}
+          new_state = delete_agent(state, agent_id)
           handle_call({:get_or_spawn, agent_id, agent_module, opts}, from, new_state)
         end
     end
@@ -150,9 +168,8 @@ defmodule Synapse.AgentRegistry do
       ref = Process.monitor(pid)
 
       new_state = %{
-        state
-        | agents: Map.put(state.agents, agent_id, pid),
-          monitors: Map.put(state.monitors, ref, agent_id)
+        put_agent(state, agent_id, pid)
+        | monitors: Map.put(state.monitors, ref, agent_id)
       }
 
       {:reply, :ok, new_state}
@@ -161,7 +178,17 @@ defmodule Synapse.AgentRegistry do
 
   @impl true
   def handle_call({:unregister, agent_id}, _from, state) do
-    new_state = %{state | agents: Map.delete(state.agents, agent_id)}
+    # Drop the monitor as well so the monitors map stays bounded and a late
+    # :DOWN for this pid cannot evict an agent re-registered under the same id.
+    monitors =
+      state.monitors
+      |> Enum.filter(fn {_ref, id} -> id == agent_id end)
+      |> Enum.reduce(state.monitors, fn {ref, _id}, acc ->
+        Process.demonitor(ref, [:flush])
+        Map.delete(acc, ref)
+      end)
+
+    new_state = %{delete_agent(state, agent_id) | monitors: monitors}
     {:reply, :ok, new_state}
   end
 
@@ -181,9 +208,8 @@ defmodule Synapse.AgentRegistry do
         Logger.debug("AgentRegistry: Agent process terminated", agent_id: agent_id)
 
         new_state = %{
-          state
-          | agents: Map.delete(state.agents, agent_id),
-            monitors: Map.delete(state.monitors, ref)
+          delete_agent(state, agent_id)
+          | monitors: Map.delete(state.monitors, ref)
         }
 
         {:noreply, new_state}
@@ -192,6 +218,22 @@ defmodule Synapse.AgentRegistry do
 
   ## Private Helpers
 
+  defp init_table(name) when is_atom(name) and not is_nil(name) do
+    :ets.new(name, [:set, :protected, :named_table, read_concurrency: true])
+  end
+
+  defp init_table(_name), do: nil
+
+  defp put_agent(state, agent_id, pid) do
+    if state.table, do: :ets.insert(state.table, {agent_id, pid})
+    %{state | agents: Map.put(state.agents, agent_id, pid)}
+  end
+
+  defp delete_agent(state, agent_id) do
+    if state.table, do: :ets.delete(state.table, agent_id)
+    %{state | agents: Map.delete(state.agents, agent_id)}
+  end
+
   defp spawn_agent(agent_module, agent_id, opts) do
     # Stage 2: Support both GenServer agents and stateless agents
     # Check if module implements start_link/1 (GenServer)
@@ -6,7 +6,7 @@ defmodule Synapse.Application do
   use Application
 
   alias Synapse.Application.Orchestrator, as: OrchestratorApp
-  alias Synapse.{Repo, Runtime, Telemetry}
+  alias Synapse.{ReqLLM, Repo, Runtime, Telemetry}
   alias Synapse.Signal.Registry, as: SignalRegistry
 
   @impl true
@@ -20,6 +20,10 @@ defmodule Synapse.Application do
       [
         SignalRegistry,
         Repo,
+        {Finch, name: Synapse.Finch, pools: finch_pools()},
+        ReqLLM.Limiter,
+        ReqLLM.CircuitBreaker,
+        ReqLLM.ResponseCache,
         {Runtime, runtime_opts}
       ] ++
         orchestrator_children(orchestrator_config, runtime_name) ++
@@ -30,12 +34,22 @@ defmodule Synapse.Application do
     # See https://hexdocs.pm/elixir/Supervisor.html
     # for other strategies and supported options
     opts = [strategy: :one_for_one, name: Synapse.Supervisor]
-    Supervisor.start_link(children, opts)
+
+    with {:ok, pid} <- Supervisor.start_link(children, opts) do
+      ReqLLM.warm_up()
+      {:ok, pid}
+    end
   end
 
   @impl true
   def config_change(_changed, _new, _removed), do: :ok
 
+  defp finch_pools do
+    :synapse
+    |> Application.get_env(Synapse.Finch, [])
+    |> Keyword.get(:pools, %{default: [size: 50, count: 1]})
+  end
+
   defp orchestrator_children(config, runtime_name) do
     case OrchestratorApp.child_spec(config, runtime_name) do
       nil -> []
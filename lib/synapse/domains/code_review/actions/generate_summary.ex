@@ -66,7 +66,7 @@ defmodule Synapse.Domains.CodeReview.Actions.GenerateSummary do
       metadata: params.metadata
     }
 
-    Logger.info("Review summary generated",
+    Logger.debug("Review summary generated",
       review_id: params.review_id,
       status: status,
       severity: severity,
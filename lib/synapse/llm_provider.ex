@@ -152,5 +152,21 @@ defmodule Synapse.LLMProvider do
   """
   @callback default_config() :: keyword()
 
-  @optional_callbacks [supported_features: 0, default_config: 0]
+  @doc """
+  Parses one decoded server-sent event from a streaming response.
+
+  Providers that implement this callback can be used with
+  `Synapse.ReqLLM.stream_chat_completion/3`. The returned `:content` is the text
+  delta carried by the event (or `nil`), and `:metadata` holds any response
+  metadata it reveals; `nil` metadata values are ignored when merging.
+
+  ## Returns
+
+    * `{:ok, %{content: String.t() | nil, metadata: map()}}` - Parsed event
+    * `{:error, Exception.t()}` - The provider reported an error mid-stream
+  """
+  @callback parse_stream_chunk(chunk :: map(), metadata :: request_metadata()) ::
+              {:ok, %{content: String.t() | nil, metadata: map()}} | {:error, error_t()}
+
+  @optional_callbacks [supported_features: 0, default_config: 0, parse_stream_chunk: 2]
 end
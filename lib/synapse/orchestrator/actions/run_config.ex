@@ -89,12 +89,12 @@ defmodule Synapse.Orchestrator.Actions.RunConfig do
         end
       rescue
         error ->
-          Logger.error("""
-          Failed to publish orchestrator result
-          topic=#{inspect(topic)} router=#{inspect(router)} config=#{config_id}
-          payload=#{inspect(result)}
-          #{Exception.format(:error, error, __STACKTRACE__)}
-          """)
+          Logger.error("Failed to publish orchestrator result",
+            router: router,
+            topic: topic,
+            config: config_id,
+            reason: Exception.format(:error, error, __STACKTRACE__)
+          )
       end
     end)
   end
@@ -67,6 +67,7 @@ defmodule Synapse.Orchestrator.AgentConfig do
           registry: atom() | nil,
           spawn_condition: (-> boolean()) | nil,
           depends_on: [agent_id()],
+          max_concurrency: pos_integer(),
           metadata: map()
         }
 
@@ -83,71 +84,81 @@ defmodule Synapse.Orchestrator.AgentConfig do
     :spawn_condition,
     actions: [],
     depends_on: [],
+    max_concurrency: 1,
     metadata: %{}
   ]
 
+  @schema [
+    id: [
+      type: :atom,
+      required: true,
+      doc: "Unique identifier for the agent"
+    ],
+    type: [
+      type: {:in, [:specialist, :orchestrator, :custom]},
+      required: true,
+      doc: "Agent archetype controlling mandatory fields"
+    ],
+    actions: [
+      type: {:list, :atom},
+      default: [],
+      doc: "List of action modules executed by the agent"
+    ],
+    signals: [
+      type: {:custom, __MODULE__, :validate_signals, []},
+      required: true,
+      doc: "Signal subscription and emission configuration (router topics)"
+    ],
+    result_builder: [
+      type: {:or, [{:fun, 2}, {:fun, 3}, :mfa]},
+      doc: "Callable that converts action outputs into an emitted signal payload"
+    ],
+    orchestration: [
+      type: {:custom, __MODULE__, :validate_orchestration, []},
+      doc: "Coordinator-specific behaviour configuration"
+    ],
+    custom_handler: [
+      type: {:or, [{:fun, 2}, :mfa]},
+      doc: "Custom callback used by :custom agents"
+    ],
+    state_schema: [
+      type: :keyword_list,
+      doc: "NimbleOptions schema describing persistent agent state"
+    ],
+    registry: [
+      type: :atom,
+      doc: "Registry used to register running agent processes"
+    ],
+    spawn_condition: [
+      type: {:fun, 0},
+      doc: "Predicate to decide if the agent should run based on runtime state"
+    ],
+    depends_on: [
+      type: {:list, :atom},
+      default: [],
+      doc: "Other agent ids that must be running before this agent starts"
+    ],
+    max_concurrency: [
+      type: :pos_integer,
+      default: 1,
+      doc:
+        "Maximum number of signals a non-orchestrator agent processes at once (orchestrators always run one at a time)"
+    ],
+    metadata: [
+      type: :map,
+      default: %{},
+      doc: "Arbitrary metadata stored alongside the configuration"
+    ]
+  ]
+
+  # Compiled once at build time so validation skips re-checking the schema.
+  @compiled_schema NimbleOptions.new!(@schema)
+
   @doc """
   Returns the NimbleOptions schema used to validate agent configurations.
   """
   @spec schema() :: NimbleOptions.schema()
-  def schema do
-    [
-      id: [
-        type: :atom,
-        required: true,
-        doc: "Unique identifier for the agent"
-      ],
-      type: [
-        type: {:in, [:specialist, :orchestrator, :custom]},
-        required: true,
-        doc: "Agent archetype controlling mandatory fields"
-      ],
-      actions: [
-        type: {:list, :atom},
-        default: [],
-        doc: "List of action modules executed by the agent"
-      ],
-      signals: [
-        type: {:custom, __MODULE__, :validate_signals, []},
-        required: true,
-        doc: "Signal subscription and emission configuration (router topics)"
-      ],
-      result_builder: [
-        type: {:or, [{:fun, 2}, {:fun, 3}, :mfa]},
-        doc: "Callable that converts action outputs into an emitted signal payload"
-      ],
-      orchestration: [
-        type: {:custom, __MODULE__, :validate_orchestration, []},
-        doc: "Coordinator-specific behaviour configuration"
-      ],
-      custom_handler: [
-        type: {:or, [{:fun, 2}, :mfa]},
-        doc: "Custom callback used by :custom agents"
-      ],
-      state_schema: [
-        type: :keyword_list,
-        doc: "NimbleOptions schema describing persistent agent state"
-      ],
-      registry: [
-        type: :atom,
-        doc: "Registry used to register running agent processes"
-      ],
-      spawn_condition: [
-        type: {:fun, 0},
-        doc: "Predicate to decide if the agent should run based on runtime state"
-      ],
-      depends_on: [
-        type: {:list, :atom},
-        default: [],
-        doc: "Other agent ids that must be running before this agent starts"
-      ],
-      metadata: [
-        type: :map,
-        default: %{},
-        doc: "Arbitrary metadata stored alongside the configuration"
-      ]
-    ]
-  end
+  def schema, do: @schema
 
   @doc """
   Validates and normalises a configuration map or keyword list into an
@@ -159,7 +170,7 @@ defmodule Synapse.Orchestrator.AgentConfig do
   def new(config) when is_map(config), do: config |> Map.to_list() |> new()
 
   def new(config) when is_list(config) do
-    with {:ok, validated} <- NimbleOptions.validate(config, schema()),
+    with {:ok, validated} <- NimbleOptions.validate(config, @compiled_schema),
          {:ok, with_roles} <- apply_role_defaults(validated),
          {:ok, coerced} <- enforce_archetype_rules(with_roles) do
       {:ok, struct(__MODULE__, Map.new(coerced))}
@@ -4,6 +4,11 @@ defmodule Synapse.Orchestrator.DynamicAgent do
 
   Each dynamic agent subscribes to the configured `Synapse.SignalRouter` topics,
   runs the configured Jido actions, and emits results back through the router.
+
+  Orchestrators handle one signal at a time because each run threads the agent
+  state into the next. Other agents with `max_concurrency` above `1` run their
+  actions in tasks so a slow LLM call does not hold up the rest of the mailbox;
+  signals beyond the limit wait in a queue.
   """
 
   use GenServer
@@ -45,7 +50,9 @@ defmodule Synapse.Orchestrator.DynamicAgent do
       config: config,
       router: router,
       subscriptions: subscriptions,
-      agent_state: build_initial_state(config.state_schema)
+      agent_state: build_initial_state(config.state_schema),
+      tasks: %{},
+      pending: :queue.new()
     }
 
     {:ok, state}
@@ -53,15 +60,39 @@ defmodule Synapse.Orchestrator.DynamicAgent do
 
   @impl true
   def handle_info({:signal, signal}, state) do
-    case process_signal(signal, state) do
-      {:ok, new_agent_state} ->
-        {:noreply, %{state | agent_state: new_agent_state}}
+    cond do
+      not concurrent?(state.config) ->
+        case process_signal(signal, state) do
+          {:ok, new_agent_state} ->
+            {:noreply, %{state | agent_state: new_agent_state}}
+
+          {:error, _reason} ->
+            {:noreply, state}
+        end
+
+      map_size(state.tasks) < state.config.max_concurrency ->
+        {:noreply, start_task(signal, state)}
 
-      {:error, _reason} ->
-        {:noreply, state}
+      true ->
+        {:noreply, %{state | pending: :queue.in(signal, state.pending)}}
     end
   end
 
+  def handle_info({ref, _result}, state) when is_map_key(state.tasks, ref) do
+    Process.demonitor(ref, [:flush])
+    {:noreply, task_finished(ref, state)}
+  end
+
+  def handle_info({:DOWN, ref, :process, _pid, reason}, state)
+      when is_map_key(state.tasks, ref) do
+    Logger.warning("Dynamic agent task crashed",
+      agent_id: state.config.id,
+      reason: inspect(reason)
+    )
+
+    {:noreply, task_finished(ref, state)}
+  end
+
   def handle_info(_other, state), do: {:noreply, state}
 
   @impl true
@@ -75,20 +106,34 @@ defmodule Synapse.Orchestrator.DynamicAgent do
 
   ## Internal helpers
 
+  defp concurrent?(%AgentConfig{type: :orchestrator}), do: false
+  defp concurrent?(%AgentConfig{max_concurrency: max}), do: max > 1
+
+  defp start_task(signal, state) do
+    task = Task.async(fn -> process_signal(signal, state) end)
+    %{state | tasks: Map.put(state.tasks, task.ref, signal.id)}
+  end
+
+  defp task_finished(ref, state) do
+    state = %{state | tasks: Map.delete(state.tasks, ref)}
+
+    case :queue.out(state.pending) do
+      {{:value, signal}, pending} -> start_task(signal, %{state | pending: pending})
+      {:empty, _pending} -> state
+    end
+  end
+
   defp process_signal(signal, state) do
+    data = Map.new(signal.data)
+
     request_id =
-      signal.data
-      |> Map.new()
-      |> then(fn data ->
-        Map.get(data, :request_id) ||
-          Map.get(data, "request_id") ||
-          Map.get(data, :review_id) ||
-          Map.get(data, "review_id")
-      end)
+      Map.get(data, :request_id) ||
+        Map.get(data, "request_id") ||
+        Map.get(data, :review_id) ||
+        Map.get(data, "review_id")
 
     params =
-      signal.data
-      |> Map.new()
+      data
       |> maybe_put_request_id(request_id)
       |> Map.put(:_config, state.config)
       |> Map.put(:_router, state.router)
@@ -7,6 +7,9 @@ defmodule Synapse.Orchestrator.Runtime do
   desired topology against currently running processes. Missing agents are
   spawned through `Synapse.Orchestrator.AgentFactory`, stale ones are retired,
   and crashed processes are respawned on the next reconciliation pass.
+
+  File sources are evaluated once and re-evaluated only when the file changes
+  on disk; `reload/1` always re-reads the source.
   """
 
   use GenServer
@@ -190,7 +193,7 @@ defmodule Synapse.Orchestrator.Runtime do
 
   @impl true
   def handle_cast(:reload, state) do
-    state = state |> load_configurations() |> reconcile_state()
+    state = state |> load_configurations(force: true) |> reconcile_state()
     {:noreply, state}
   end
 
@@ -392,13 +395,29 @@ defmodule Synapse.Orchestrator.Runtime do
 
   defp maybe_put_directories(opts, _), do: opts
 
-  defp load_configurations(%State{} = state) do
+  defp load_configurations(%State{} = state, opts \\ []) do
+    stamp = config_stamp(state.config_source)
+
+    case state.config_cache do
+      {^stamp, configs} when not is_nil(stamp) ->
+        if Keyword.get(opts, :force, false) do
+          evaluate_configurations(state, stamp)
+        else
+          %{state | agent_configs: configs}
+        end
+
+      _ ->
+        evaluate_configurations(state, stamp)
+    end
+  end
+
+  defp evaluate_configurations(%State{} = state, stamp) do
     case fetch_raw_configs(state.config_source) do
       {:ok, raw_configs} ->
         case validate_configs(raw_configs) do
           {:ok, configs} ->
             filtered = filter_configs(configs, state.include_types)
-            %{state | agent_configs: filtered}
+            %{state | agent_configs: filtered, config_cache: {stamp, filtered}}
 
           {:error, error} ->
             Logger.error("Failed to validate agent configs", error: Exception.message(error))
@@ -540,6 +559,20 @@ defmodule Synapse.Orchestrator.Runtime do
     :exit, _ -> :ok
   end
 
+  # Config files are only re-evaluated when their contents change, so periodic
+  # reconciliation does not recompile an unchanged file. Hashing the contents
+  # is far cheaper than evaluating them and, unlike mtime (one-second
+  # resolution), catches same-size edits made within the same second.
+  # Module sources are cheap to call and are never cached.
+  defp config_stamp(source) when is_binary(source) do
+    case File.read(source) do
+      {:ok, contents} -> :erlang.md5(contents)
+      {:error, _reason} -> nil
+    end
+  end
+
+  defp config_stamp(_source), do: nil
+
   defp fetch_raw_configs(source) when is_binary(source) do
     if File.exists?(source) do
       try do
@@ -36,54 +36,57 @@ defmodule Synapse.Orchestrator.Runtime.RunningAgent do
     metadata: %{}
   ]
 
+  @schema [
+    agent_id: [
+      type: :atom,
+      required: true,
+      doc: "Agent identifier"
+    ],
+    pid: [
+      type: {:custom, __MODULE__, :validate_pid, []},
+      required: true,
+      doc: "PID of the running agent process"
+    ],
+    config: [
+      type: {:custom, __MODULE__, :validate_config, []},
+      required: true,
+      doc: "Validated agent configuration struct"
+    ],
+    monitor_ref: [
+      type: {:custom, __MODULE__, :validate_reference, []},
+      required: true,
+      doc: "Monitor reference created for the agent PID"
+    ],
+    spawned_at: [
+      type: {:custom, __MODULE__, :validate_datetime, []},
+      required: true,
+      doc: "UTC timestamp when the agent was spawned"
+    ],
+    spawn_count: [
+      type: {:custom, __MODULE__, :validate_spawn_count, []},
+      required: true,
+      doc: "Number of times the agent has been spawned"
+    ],
+    last_error: [
+      type: :any,
+      doc: "Last error encountered by the agent (if any)",
+      default: nil
+    ],
+    metadata: [
+      type: :map,
+      default: %{},
+      doc: "Arbitrary runtime metadata"
+    ]
+  ]
+
+  # Compiled once at build time so validation skips re-checking the schema.
+  @compiled_schema NimbleOptions.new!(@schema)
+
   @doc """
   Returns the NimbleOptions schema for runtime agent records.
   """
   @spec schema() :: NimbleOptions.schema()
-  def schema do
-    [
-      agent_id: [
-        type: :atom,
-        required: true,
-        doc: "Agent identifier"
-      ],
-      pid: [
-        type: {:custom, __MODULE__, :validate_pid, []},
-        required: true,
-        doc: "PID of the running agent process"
-      ],
-      config: [
-        type: {:custom, __MODULE__, :validate_config, []},
-        required: true,
-        doc: "Validated agent configuration struct"
-      ],
-      monitor_ref: [
-        type: {:custom, __MODULE__, :validate_reference, []},
-        required: true,
-        doc: "Monitor reference created for the agent PID"
-      ],
-      spawned_at: [
-        type: {:custom, __MODULE__, :validate_datetime, []},
-        required: true,
-        doc: "UTC timestamp when the agent was spawned"
-      ],
-      spawn_count: [
-        type: {:custom, __MODULE__, :validate_spawn_count, []},
-        required: true,
-        doc: "Number of times the agent has been spawned"
-      ],
-      last_error: [
-        type: :any,
-        doc: "Last error encountered by the agent (if any)",
-        default: nil
-      ],
-      metadata: [
-        type: :map,
-        default: %{},
-        doc: "Arbitrary runtime metadata"
-      ]
-    ]
-  end
+  def schema, do: @schema
 
   @doc """
   Builds a `%RunningAgent{}` struct from a keyword list or map, validating
@@ -93,7 +96,7 @@ defmodule Synapse.Orchestrator.Runtime.RunningAgent do
   def new(attrs) when is_map(attrs), do: attrs |> Map.to_list() |> new()
 
   def new(attrs) when is_list(attrs) do
-    with {:ok, validated} <- NimbleOptions.validate(attrs, schema()) do
+    with {:ok, validated} <- NimbleOptions.validate(attrs, @compiled_schema) do
       {:ok, struct(__MODULE__, Map.new(validated))}
     end
   end
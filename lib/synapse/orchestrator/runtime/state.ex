@@ -9,6 +9,7 @@ defmodule Synapse.Orchestrator.Runtime.State do
   @type t :: %__MODULE__{
           config_source: String.t() | module(),
           agent_configs: [AgentConfig.t()],
+          config_cache: {term(), [AgentConfig.t()]} | nil,
           running_agents: %{optional(agent_id()) => RunningAgent.t()},
           monitors: %{optional(reference()) => agent_id()},
           router: atom() | nil,
@@ -25,6 +26,7 @@ defmodule Synapse.Orchestrator.Runtime.State do
   defstruct [
     :config_source,
     agent_configs: [],
+    config_cache: nil,
     running_agents: %{},
     monitors: %{},
     router: nil,
@@ -34,6 +34,7 @@ defmodule Synapse.Providers.OpenAI do
     |> Map.put("model", model)
     |> maybe_put_number("temperature", temperature)
     |> maybe_put_number("max_completion_tokens", max_tokens)
+    |> maybe_put_stream(Map.get(params, :stream))
   end
 
   @impl true
@@ -71,6 +72,48 @@ defmodule Synapse.Providers.OpenAI do
     {:error, translate_error({:http_error, status, body}, metadata)}
   end
 
+  @impl true
+  def parse_stream_chunk(%{"error" => _} = chunk, metadata) do
+    profile_name = metadata[:profile] || "unknown"
+    provider_message = extract_provider_message(chunk)
+
+    message =
+      if provider_message do
+        "OpenAI stream failed for profile #{profile_name}: " <> provider_message
+      else
+        "OpenAI stream failed for profile #{profile_name}"
+      end
+
+    {:error,
+     Error.execution_error(message, %{
+       profile: profile_name,
+       provider: :openai,
+       body: sanitize_body(chunk)
+     })}
+  end
+
+  def parse_stream_chunk(chunk, _metadata) do
+    choice =
+      case Map.get(chunk, "choices") do
+        [choice | _] -> choice
+        _ -> %{}
+      end
+
+    {:ok,
+     %{
+       content: get_in(choice, ["delta", "content"]),
+       metadata: %{
+         provider_id: Map.get(chunk, "id"),
+         total_tokens: get_in(chunk, ["usage", "total_tokens"]),
+         prompt_tokens: get_in(chunk, ["usage", "prompt_tokens"]),
+         completion_tokens: get_in(chunk, ["usage", "completion_tokens"]),
+         finish_reason: Map.get(choice, "finish_reason"),
+         model: Map.get(chunk, "model"),
+         provider: :openai
+       }
+     }}
+  end
+
   @impl true
   def translate_error({:http_error, status, body}, metadata) do
     profile_name = metadata[:profile] || "unknown"
@@ -206,6 +249,13 @@ defmodule Synapse.Providers.OpenAI do
   defp maybe_put_number(map, key, value) when is_number(value), do: Map.put(map, key, value)
   defp maybe_put_number(map, _key, _value), do: map
 
+  # Usage is only reported on streamed responses when explicitly requested.
+  defp maybe_put_stream(body, true) do
+    Map.merge(body, %{"stream" => true, "stream_options" => %{"include_usage" => true}})
+  end
+
+  defp maybe_put_stream(body, _stream), do: body
+
   defp maybe_put(map, _key, nil), do: map
   defp maybe_put(map, key, value), do: Map.put(map, key, value)
 
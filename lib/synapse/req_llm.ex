@@ -40,8 +40,27 @@ defmodule Synapse.ReqLLM do
     * `:endpoint` – request path (defaults to `/v1/chat/completions`, supports `"{model}"` token)
     * `:req_options` – additional Req options (defaults: connect_timeout: 5000, pool_timeout: 5000, receive_timeout: 600000)
     * `:retry` – retry configuration (see below)
+    * `:concurrency` – in-flight request cap (see below)
     * `:plug`, `:plug_owner` – Req.Test settings for tests
     * `:temperature`, `:max_tokens` – profile-level defaults
+    * `:max_prompt_bytes` – reject oversized prompts before any request is sent
+
+  ## Connection Pooling
+
+  Requests reuse the `Synapse.Finch` pool started by the application, so
+  concurrent calls to the same provider share warm keep-alive connections
+  instead of paying a TLS handshake each time. Pools are configured under
+  `config :synapse, Synapse.Finch, pools: ...` using Finch's pool options, for
+  example multiplexing OpenAI traffic over HTTP/2:
+
+      config :synapse, Synapse.Finch,
+        pools: %{
+          :default => [size: 50],
+          "https://api.openai.com" => [protocols: [:http2], count: 2]
+        }
+
+  Profiles that set `:finch`, `:connect_options`, or `:inet6` in
+  `:req_options` keep Req's own pool selection.
 
   ## System Prompt Precedence
 
@@ -97,6 +116,66 @@ defmodule Synapse.ReqLLM do
 
   Uses exponential backoff with jitter: `base * (2^attempt) + random_jitter`
 
+  ## Concurrency Limits
+
+  Profiles can cap how many requests are in flight at once so bursts queue
+  locally instead of piling onto a provider that is already throttling:
+
+      concurrency: [
+        max_in_flight: 16,         # Concurrent requests allowed for the profile
+        queue_timeout_ms: 5_000    # Wait for a free slot before failing (default: 5000)
+      ]
+
+  Callers that cannot get a slot in time receive an execution error with
+  `reason: :concurrency_limit`. See `Synapse.ReqLLM.Limiter`.
+
+  ## Circuit Breaker
+
+  Profiles can stop sending requests to a provider that keeps failing, instead
+  of making every caller wait out its own timeouts and retries:
+
+      circuit_breaker: [
+        failure_threshold: 5,      # Consecutive failures that open the circuit (default: 5)
+        cooldown_ms: 30_000        # Time before a probe request is allowed (default: 30000)
+      ]
+
+  Transport errors and 408, 429, and 5xx responses (after retries) count as
+  failures; other errors, such as 4xx responses, leave the count unchanged.
+  While the circuit is open, requests fail immediately with
+  `reason: :circuit_open`. See `Synapse.ReqLLM.CircuitBreaker`.
+
+  ## Response Caching
+
+  Profiles used for repeatable prompts (evaluations, self-checks) can serve
+  identical requests from memory instead of calling the provider again:
+
+      response_cache: [
+        ttl_ms: 300_000,           # How long a completion is served (default: 300000)
+        max_entries: 1_024         # Cache size limit (default: 1024)
+      ]
+
+  Only non-streaming requests whose effective temperature is explicitly `0`
+  are cached, since anything else (including the provider's default
+  temperature) samples. A request is identical when its profile, model,
+  resolved system prompt, params, and temperature/max token settings match.
+  Cache hits emit the usual `:stop` telemetry with `cached: true` and no
+  `token_usage`. See `Synapse.ReqLLM.ResponseCache`.
+
+  ## Streaming
+
+  `stream_chat_completion/3` requests a server-sent event stream and hands each
+  text delta to a callback as soon as it arrives, so callers can surface the
+  first tokens long before the completion finishes:
+
+      ReqLLM.stream_chat_completion(%{prompt: "Hello"}, &send(pid, {:delta, &1}),
+        profile: :openai
+      )
+
+  Streaming is available for providers implementing
+  `c:Synapse.LLMProvider.parse_stream_chunk/2` (currently
+  `Synapse.Providers.OpenAI`). Retries only apply before any data has been
+  delivered, since they are triggered by the response status.
+
   ## Per-Request Options
 
   The `chat_completion/2` function accepts options to override profile defaults:
@@ -122,11 +201,44 @@ defmodule Synapse.ReqLLM do
 
   alias Altar.AI.Integrations.Synapse, as: AltarSynapse
   alias Jido.Error
-  alias Synapse.ReqLLM.Options
+  alias Synapse.ReqLLM.{CircuitBreaker, Limiter, Options, ResponseCache, SSE, SystemPrompt}
+  require Logger
 
   @type message :: %{required(:role) => String.t(), required(:content) => String.t()}
 
   @default_model "gpt-4o-mini"
+  @config_cache_key {__MODULE__, :config}
+  @request_cache_key {__MODULE__, :requests}
+  @altar_ai_key {__MODULE__, :altar_ai_loaded?}
+  @deprecation_warned_key {__MODULE__, :deprecation_warned}
+  @payload_format_modules %{
+    google_generate_content: Synapse.Providers.Gemini,
+    openai: Synapse.Providers.OpenAI
+  }
+  @payload_format_providers %{google_generate_content: :gemini, openai: :openai}
+  @legacy_profile_keys [
+    :base_url,
+    :api_key,
+    :model,
+    :allowed_models,
+    :system_prompt,
+    :plug,
+    :plug_owner,
+    :endpoint,
+    :req_options,
+    :temperature,
+    :max_tokens,
+    :max_prompt_bytes,
+    :retry,
+    :concurrency,
+    :circuit_breaker,
+    :response_cache,
+    :payload_format,
+    :provider_module,
+    :auth_header,
+    :auth_header_prefix
+  ]
+  @legacy_global_keys [:system_prompt, :default_model]
   @profile_key_map %{
     "base_url" => :base_url,
     "api_key" => :api_key,
@@ -139,6 +251,10 @@ defmodule Synapse.ReqLLM do
     "req_options" => :req_options,
     "temperature" => :temperature,
     "max_tokens" => :max_tokens,
+    "max_prompt_bytes" => :max_prompt_bytes,
+    "concurrency" => :concurrency,
+    "circuit_breaker" => :circuit_breaker,
+    "response_cache" => :response_cache,
     "auth_header" => :auth_header,
     "auth_header_prefix" => :auth_header_prefix
   }
@@ -146,16 +262,7 @@ defmodule Synapse.ReqLLM do
   @deprecated "Use Altar.AI.Integrations.Synapse.chat_completion/2 instead"
   @spec chat_completion(map(), keyword()) :: {:ok, map()} | {:error, Error.t()}
   def chat_completion(params, opts \\ []) when is_map(params) and is_list(opts) do
-    # Emit deprecation warning (only once per process to avoid spam)
-    unless Process.get(:synapse_reqllm_deprecation_warned) || suppress_warnings?() do
-      IO.warn(
-        "Synapse.ReqLLM.chat_completion/2 is deprecated. " <>
-          "Use Altar.AI.Integrations.Synapse.chat_completion/2 instead.",
-        []
-      )
-
-      Process.put(:synapse_reqllm_deprecation_warned, true)
-    end
+    maybe_warn_deprecated()
 
     # Delegate to Altar.AI if available, otherwise fall back to legacy implementation
     if altar_ai_available?() do
@@ -171,28 +278,189 @@ defmodule Synapse.ReqLLM do
     chat_completion_legacy(params, opts)
   end
 
+  @doc """
+  Streams a chat completion, invoking `on_chunk` with each text delta as it
+  arrives.
+
+  Accepts the same params and options as `chat_completion/2` and returns the
+  same `{:ok, %{content: ..., metadata: ...}}` shape once the stream finishes,
+  with `content` holding the full text. `on_chunk` runs in the calling process
+  and its return value is ignored.
+
+  Streaming always uses the built-in client and requires a provider that
+  implements `c:Synapse.LLMProvider.parse_stream_chunk/2`.
+
+  ## Options
+
+  In addition to the `chat_completion/2` options:
+
+    * `:coalesce_bytes` – buffer deltas until at least this many bytes are
+      pending before invoking `on_chunk` (default: `0`, no size threshold)
+    * `:coalesce_ms` – buffer deltas until the oldest pending one has waited
+      this many milliseconds (default: `0`, no time threshold). The window is
+      checked as deltas arrive, so it bounds how long a delta waits for
+      company rather than starting a timer.
+
+  With both thresholds at `0` every delta is delivered as it arrives; when
+  both are set, whichever is reached first flushes the buffer. Anything still
+  buffered is delivered when the stream ends.
+
+  ## Examples
+
+      ReqLLM.stream_chat_completion(%{prompt: "Hello"}, &IO.write/1, profile: :openai)
+  """
+  @spec stream_chat_completion(map(), (String.t() -> any()), keyword()) ::
+          {:ok, map()} | {:error, Error.t()}
+  def stream_chat_completion(params, on_chunk, opts \\ [])
+      when is_map(params) and is_function(on_chunk, 1) and is_list(opts) do
+    stream = %{
+      on_chunk: on_chunk,
+      coalesce_bytes: Keyword.get(opts, :coalesce_bytes, 0),
+      coalesce_ms: Keyword.get(opts, :coalesce_ms, 0)
+    }
+
+    run_completion(params, opts, {:stream, stream})
+  end
+
+  @doc """
+  Runs a chat completion for every entry in `params_list` concurrently and
+  returns the results in the same order.
+
+  Each entry is sent exactly as `chat_completion/2` would send it, so the
+  profile's `:retry` and `:concurrency` settings still apply per request. A
+  failed entry, including one that raises or exits, returns `{:error, ...}` in
+  its slot without cancelling the others.
+
+  ## Options
+
+  In addition to the `chat_completion/2` options:
+
+    * `:max_concurrency` – requests started at once (default:
+      `System.schedulers_online() * 2`)
+    * `:batch_timeout` – how long each entry may run in milliseconds,
+      including retries and queueing (default: `:infinity`); entries that
+      exceed it are shut down and return an execution error
+
+  ## Examples
+
+      ReqLLM.batch_chat_completion([%{prompt: "One"}, %{prompt: "Two"}], profile: :openai)
+  """
+  @spec batch_chat_completion([map()], keyword()) :: [{:ok, map()} | {:error, Error.t()}]
+  def batch_chat_completion(params_list, opts \\ [])
+      when is_list(params_list) and is_list(opts) do
+    {batch_opts, request_opts} = Keyword.split(opts, [:max_concurrency, :batch_timeout])
+
+    params_list
+    |> Task.async_stream(&batch_entry(&1, request_opts),
+      max_concurrency: Keyword.get(batch_opts, :max_concurrency, System.schedulers_online() * 2),
+      ordered: true,
+      timeout: Keyword.get(batch_opts, :batch_timeout, :infinity),
+      on_timeout: :kill_task
+    )
+    |> Enum.map(fn
+      {:ok, result} -> result
+      {:exit, reason} -> {:error, batch_error(request_opts, reason)}
+    end)
+  end
+
+  # Tasks are linked to the caller, so a raising entry must not escape its task.
+  defp batch_entry(params, opts) do
+    chat_completion(params, opts)
+  rescue
+    exception -> {:error, batch_error(opts, Exception.message(exception))}
+  catch
+    kind, reason -> {:error, batch_error(opts, {kind, reason})}
+  end
+
+  defp batch_error(opts, reason) do
+    Error.execution_error("LLM batch request did not complete", %{
+      profile: Keyword.get(opts, :profile),
+      reason: reason
+    })
+  end
+
+  @doc """
+  Validates the configuration and builds the base request for every profile so
+  the first chat completion does not pay that setup cost.
+
+  Always returns `:ok`; configuration errors surface on the first request.
+  """
+  @spec warm_up() :: :ok
+  def warm_up do
+    _ = altar_ai_loaded?()
+
+    with {:ok, config} <- fetch_config() do
+      Enum.each(config.profiles, fn {profile_name, profile_config} ->
+        _ = cached_request(profile_name, normalize_profile_config(profile_config))
+      end)
+    end
+
+    :ok
+  rescue
+    ArgumentError -> :ok
+  end
+
+  @doc false
+  @spec altar_ai_loaded?() :: boolean()
+  def altar_ai_loaded? do
+    # A failed Code.ensure_loaded?/1 walks the whole code path, so the answer is
+    # resolved once per node instead of on every request.
+    case :persistent_term.get(@altar_ai_key, nil) do
+      nil ->
+        loaded? =
+          Code.ensure_loaded?(AltarSynapse) and
+            function_exported?(AltarSynapse, :chat_completion, 2)
+
+        :persistent_term.put(@altar_ai_key, loaded?)
+        loaded?
+
+      loaded? ->
+        loaded?
+    end
+  end
+
   defp altar_ai_available? do
     # Allow tests to force legacy implementation via application env
-    not Application.get_env(:synapse, :force_legacy_req_llm, false) and
-      Code.ensure_loaded?(Altar.AI.Integrations.Synapse) and
-      function_exported?(Altar.AI.Integrations.Synapse, :chat_completion, 2)
+    not Application.get_env(:synapse, :force_legacy_req_llm, false) and altar_ai_loaded?()
   end
 
   defp delegate_to_altar_ai(params, opts) do
     AltarSynapse.chat_completion(params, opts)
   end
 
+  # Warn once per node through Logger rather than once per calling process via
+  # IO.warn/2, which writes synchronously to stderr from every new task.
+  defp maybe_warn_deprecated do
+    unless :persistent_term.get(@deprecation_warned_key, false) or suppress_warnings?() do
+      :persistent_term.put(@deprecation_warned_key, true)
+
+      Logger.warning(
+        "Synapse.ReqLLM.chat_completion/2 is deprecated. " <>
+          "Use Altar.AI.Integrations.Synapse.chat_completion/2 instead."
+      )
+    end
+
+    :ok
+  end
+
   defp suppress_warnings? do
     Application.get_env(:synapse, :suppress_reqllm_warnings, false)
   end
 
   defp chat_completion_legacy(params, opts) when is_map(params) and is_list(opts) do
+    run_completion(params, opts, :sync)
+  end
+
+  defp run_completion(params, opts, mode) do
     request_id = generate_request_id()
     start_time = System.monotonic_time()
 
     with {:ok, config} <- fetch_config(),
          {:ok, profile_name, profile_config} <- resolve_profile(config, opts),
-         {:ok, model} <- resolve_model(profile_name, profile_config, config, opts) do
+         {:ok, model} <- resolve_model(profile_name, profile_config, config, opts),
+         :ok <- check_prompt_size(params, profile_name, profile_config) do
+      provider = determine_provider(profile_config)
+
       # Emit start telemetry event
       :telemetry.execute(
         [:synapse, :llm, :request, :start],
@@ -201,7 +469,7 @@ defmodule Synapse.ReqLLM do
           request_id: request_id,
           profile: profile_name,
           model: model,
-          provider: determine_provider(profile_config)
+          provider: provider
         }
       )
 
@@ -209,27 +477,39 @@ defmodule Synapse.ReqLLM do
       provider_module = resolve_provider_module(profile_config)
 
       # Execute the request
-      result =
-        with {:ok, request} <- build_request(profile_config),
-             {:ok, response} <-
-               execute_request(
-                 request,
-                 params,
-                 config,
-                 profile_name,
-                 profile_config,
-                 model,
-                 opts,
-                 provider_module
-               ) do
-          parse_response(response, profile_name, model, provider_module)
-        end
+      cache_request = {profile_name, model, params, opts, config}
+
+      {result, cached?} =
+        with_response_cache(cache_request, profile_config, mode, fn ->
+          with_circuit_breaker(profile_name, profile_config, fn ->
+            with_concurrency_slot(profile_name, profile_config, fn ->
+              with :ok <- check_streaming_support(mode, profile_name, provider_module),
+                   {:ok, request} <- cached_request(profile_name, profile_config),
+                   {:ok, response} <-
+                     execute_request(
+                       request,
+                       params,
+                       config,
+                       profile_name,
+                       profile_config,
+                       model,
+                       opts,
+                       provider_module,
+                       mode
+                     ) do
+                parse_response(response, profile_name, model, provider_module, mode)
+              end
+            end)
+          end)
+        end)
 
       # Emit appropriate telemetry based on result
       case result do
         {:ok, response_data} ->
           duration = System.monotonic_time() - start_time
-          token_usage = extract_token_usage(response_data)
+
+          # Cache hits spent no tokens, so they carry no usage to account for.
+          token_usage = if cached?, do: nil, else: extract_token_usage(response_data)
 
           :telemetry.execute(
             [:synapse, :llm, :request, :stop],
@@ -238,9 +518,10 @@ defmodule Synapse.ReqLLM do
               request_id: request_id,
               profile: profile_name,
               model: model,
-              provider: determine_provider(profile_config),
+              provider: provider,
               token_usage: token_usage,
-              finish_reason: get_in(response_data, [:metadata, :finish_reason])
+              finish_reason: get_in(response_data, [:metadata, :finish_reason]),
+              cached: cached?
             }
           )
 
@@ -257,7 +538,7 @@ defmodule Synapse.ReqLLM do
               request_id: request_id,
               profile: profile_name,
               model: model,
-              provider: determine_provider(profile_config),
+              provider: provider,
               error_type: error_type,
               error_message: error_message
             }
@@ -291,11 +572,11 @@ defmodule Synapse.ReqLLM do
     case Keyword.get(profile_config, :provider_module) do
       nil ->
         # Fall back to payload_format for backwards compatibility
-        case Keyword.get(profile_config, :payload_format) do
-          :google_generate_content -> Synapse.Providers.Gemini
-          :openai -> Synapse.Providers.OpenAI
-          _ -> Synapse.Providers.OpenAI
-        end
+        Map.get(
+          @payload_format_modules,
+          Keyword.get(profile_config, :payload_format),
+          Synapse.Providers.OpenAI
+        )
 
       module when is_atom(module) ->
         module
@@ -308,13 +589,29 @@ defmodule Synapse.ReqLLM do
         {:error, Error.config_error("Synapse.ReqLLM configuration is missing")}
 
       config when is_list(config) ->
-        normalize_config(config)
+        cached_config(config)
 
       _ ->
         {:error, Error.config_error("Synapse.ReqLLM configuration must be a keyword list")}
     end
   end
 
+  # Normalizing and validating the configuration dominates request setup, so the
+  # result is memoized against the raw application env. Any change to the env
+  # produces a different term and is re-validated on the next call.
+  defp cached_config(raw_config) do
+    case :persistent_term.get(@config_cache_key, nil) do
+      {^raw_config, config} ->
+        {:ok, config}
+
+      _ ->
+        with {:ok, config} <- normalize_config(raw_config) do
+          :persistent_term.put(@config_cache_key, {raw_config, config})
+          {:ok, config}
+        end
+    end
+  end
+
   defp normalize_config(config) do
     config
     |> normalize_legacy_config()
@@ -324,31 +621,11 @@ defmodule Synapse.ReqLLM do
 
   defp normalize_legacy_config(config) do
     if Keyword.has_key?(config, :base_url) and not Keyword.has_key?(config, :profiles) do
-      profile_keys = [
-        :base_url,
-        :api_key,
-        :model,
-        :allowed_models,
-        :system_prompt,
-        :plug,
-        :plug_owner,
-        :endpoint,
-        :req_options,
-        :temperature,
-        :max_tokens,
-        :retry,
-        :payload_format,
-        :provider_module,
-        :auth_header,
-        :auth_header_prefix
-      ]
-
-      profile = Keyword.take(config, profile_keys)
-      global_keys = [:system_prompt, :default_model]
+      profile = Keyword.take(config, @legacy_profile_keys)
 
       config
-      |> Keyword.drop(profile_keys)
-      |> Keyword.take(global_keys)
+      |> Keyword.drop(@legacy_profile_keys)
+      |> Keyword.take(@legacy_global_keys)
       |> Keyword.put(:profiles, default: profile)
       |> Keyword.put(:default_profile, :default)
     else
@@ -487,8 +764,181 @@ defmodule Synapse.ReqLLM do
     end
   end
 
+  defp check_prompt_size(params, profile_name, profile_config) do
+    case Keyword.get(profile_config, :max_prompt_bytes) do
+      nil ->
+        :ok
+
+      limit ->
+        size = prompt_size(params)
+
+        if size > limit do
+          {:error,
+           Error.validation_error(
+             "Prompt for profile #{profile_name} is #{size} bytes, exceeding max_prompt_bytes #{limit}",
+             %{profile: profile_name, size: size, limit: limit}
+           )}
+        else
+          :ok
+        end
+    end
+  end
+
+  defp prompt_size(params) do
+    prompt_bytes =
+      case Map.get(params, :prompt) do
+        prompt when is_binary(prompt) -> byte_size(prompt)
+        _ -> 0
+      end
+
+    params
+    |> Map.get(:messages, [])
+    |> Enum.reduce(prompt_bytes, fn message, acc ->
+      case Map.get(message, :content) || Map.get(message, "content") do
+        content when is_binary(content) -> acc + byte_size(content)
+        _ -> acc
+      end
+    end)
+  end
+
+  defp with_concurrency_slot(profile_name, profile_config, fun) do
+    case Keyword.get(profile_config, :concurrency) do
+      nil ->
+        fun.()
+
+      concurrency ->
+        max = Keyword.fetch!(concurrency, :max_in_flight)
+        timeout = Keyword.get(concurrency, :queue_timeout_ms, 5_000)
+
+        case Limiter.acquire(profile_name, max, timeout) do
+          {:ok, token} ->
+            try do
+              fun.()
+            after
+              Limiter.release(token)
+            end
+
+          {:error, :timeout} ->
+            {:error,
+             Error.execution_error(
+               "LLM profile #{profile_name} already has #{max} requests in flight; no slot freed up within #{timeout}ms",
+               %{profile: profile_name, reason: :concurrency_limit}
+             )}
+        end
+    end
+  end
+
+  # Only synchronous requests with an explicit temperature of 0 are cached;
+  # everything else samples (provider defaults included) and is meant to vary.
+  # Returns the result along with whether it was served from the cache.
+  defp with_response_cache(request, profile_config, mode, fun) do
+    {profile_name, model, params, opts, config} = request
+    cache = Keyword.get(profile_config, :response_cache)
+
+    temperature =
+      Keyword.get(opts, :temperature) || Map.get(params, :temperature) ||
+        Keyword.get(profile_config, :temperature)
+
+    if cache && mode == :sync && temperature == 0 do
+      key = {
+        profile_name,
+        model,
+        SystemPrompt.resolve(profile_config, config),
+        Keyword.take(profile_config, [:temperature, :max_tokens]),
+        params,
+        Keyword.take(opts, [:temperature, :max_tokens])
+      }
+
+      case ResponseCache.fetch(key) do
+        {:ok, response_data} ->
+          {{:ok, response_data}, true}
+
+        :error ->
+          case fun.() do
+            {:ok, response_data} ->
+              ResponseCache.put(key, response_data, cache)
+              {{:ok, response_data}, false}
+
+            error ->
+              {error, false}
+          end
+      end
+    else
+      {fun.(), false}
+    end
+  end
+
+  defp with_circuit_breaker(profile_name, profile_config, fun) do
+    case Keyword.get(profile_config, :circuit_breaker) do
+      nil ->
+        fun.()
+
+      breaker ->
+        case CircuitBreaker.allow(profile_name) do
+          :ok ->
+            run_through_breaker(profile_name, breaker, fun)
+
+          {:error, :open} ->
+            {:error,
+             Error.execution_error(
+               "LLM profile #{profile_name} is failing repeatedly; requests are paused until its circuit breaker cools down",
+               %{profile: profile_name, reason: :circuit_open}
+             )}
+        end
+    end
+  end
+
+  defp run_through_breaker(profile_name, breaker, fun) do
+    result = fun.()
+    CircuitBreaker.record(profile_name, breaker_outcome(result), breaker)
+    result
+  catch
+    kind, reason ->
+      CircuitBreaker.record(profile_name, :neutral, breaker)
+      :erlang.raise(kind, reason, __STACKTRACE__)
+  end
+
+  # Only failures that say something about the provider's health count against
+  # the breaker: throttling, server errors and transport errors (whose reason
+  # is kept as Req reported it). Other errors, such as 4xx responses, errors
+  # reported mid-stream or a local concurrency timeout, are neutral.
+  defp breaker_outcome({:ok, _response}), do: :success
+
+  defp breaker_outcome({:error, %{details: %{status: status}}})
+       when status in [408, 429] or status in 500..599,
+       do: :failure
+
+  defp breaker_outcome({:error, %{details: %{status: _status}}}), do: :neutral
+  defp breaker_outcome({:error, %{details: %{reason: :concurrency_limit}}}), do: :neutral
+
+  defp breaker_outcome({:error, %{details: %{reason: reason}}}) when not is_binary(reason),
+    do: :failure
+
+  defp breaker_outcome(_result), do: :neutral
+
   ## Request construction
 
+  # Base requests (headers, retry steps, Req options) only depend on the profile,
+  # so they are built once per profile and reused until the profile changes.
+  defp cached_request(profile_name, profile_config) do
+    requests = :persistent_term.get(@request_cache_key, %{})
+
+    case Map.fetch(requests, profile_name) do
+      {:ok, {^profile_config, request}} ->
+        {:ok, request}
+
+      _ ->
+        with {:ok, request} <- build_request(profile_config) do
+          :persistent_term.put(
+            @request_cache_key,
+            Map.put(requests, profile_name, {profile_config, request})
+          )
+
+          {:ok, request}
+        end
+    end
+  end
+
   defp build_request(profile_config) do
     with {:ok, base_url} <- fetch_required(profile_config, :base_url),
          {:ok, api_key} <- fetch_required(profile_config, :api_key) do
@@ -519,7 +969,8 @@ defmodule Synapse.ReqLLM do
          profile_config,
          model,
          opts,
-         provider_module
+         provider_module,
+         mode
        ) do
     maybe_allow_req_test(profile_config)
 
@@ -529,6 +980,7 @@ defmodule Synapse.ReqLLM do
       |> Map.put(:model, model)
       |> maybe_put_runtime_param(:temperature, Keyword.get(opts, :temperature))
       |> maybe_put_runtime_param(:max_tokens, Keyword.get(opts, :max_tokens))
+      |> maybe_put_runtime_param(:stream, match?({:stream, _}, mode) || nil)
 
     # Enhanced profile config with model
     enhanced_profile_config = Keyword.put(profile_config, :model, model)
@@ -541,12 +993,15 @@ defmodule Synapse.ReqLLM do
       |> Keyword.get(:endpoint, "/v1/chat/completions")
       |> String.replace("{model}", model)
 
+    request_metadata = %{profile: profile_name, model: model}
+
     # Apply per-request timeout overrides
-    request_opts = build_request_options(opts)
+    request_opts =
+      build_request_options(opts) ++ stream_options(mode, provider_module, request_metadata)
 
-    request_metadata = %{profile: profile_name, model: model}
+    request_opts = [url: endpoint, json: body] ++ finch_options(request) ++ request_opts
 
-    case Req.post(request, [url: endpoint, json: body] ++ request_opts) do
+    case Req.post(request, request_opts) do
       {:ok, %Req.Response{} = response} ->
         {:ok, response}
 
@@ -581,12 +1036,192 @@ defmodule Synapse.ReqLLM do
     end
   end
 
-  defp parse_response(response, profile_name, model, provider_module) do
+  defp parse_response(response, profile_name, model, provider_module, :sync) do
     # Delegate parsing to the provider module
     metadata = %{profile: profile_name, model: model}
     provider_module.parse_response(response, metadata)
   end
 
+  defp parse_response(response, profile_name, model, provider_module, {:stream, stream}) do
+    metadata = %{profile: profile_name, model: model}
+    finish_stream(response, provider_module, metadata, stream)
+  end
+
+  ## Streaming helpers
+
+  defp check_streaming_support(:sync, _profile_name, _provider_module), do: :ok
+
+  defp check_streaming_support({:stream, _stream}, profile_name, provider_module) do
+    if Code.ensure_loaded?(provider_module) and
+         function_exported?(provider_module, :parse_stream_chunk, 2) do
+      :ok
+    else
+      {:error,
+       Error.config_error(
+         "Provider #{inspect(provider_module)} for profile #{profile_name} does not support streaming",
+         %{profile: profile_name, provider_module: provider_module}
+       )}
+    end
+  end
+
+  defp stream_options(:sync, _provider_module, _metadata), do: []
+
+  # Successful bodies are parsed as they arrive; error bodies are buffered and
+  # decoded afterwards so providers can translate them as usual. Decompression
+  # is disabled because compressed chunks cannot be parsed incrementally.
+  defp stream_options({:stream, stream}, provider_module, metadata) do
+    [
+      compressed: false,
+      decode_body: false,
+      into: fn {:data, data}, {request, response} ->
+        if response.status in 200..299 do
+          state = Req.Response.get_private(response, :synapse_stream, new_stream_state(stream))
+          state = consume_events(state, data, provider_module, metadata)
+          response = Req.Response.put_private(response, :synapse_stream, state)
+
+          if state.error, do: {:halt, {request, response}}, else: {:cont, {request, response}}
+        else
+          {:cont, {request, %{response | body: error_body(response.body) <> data}}}
+        end
+      end
+    ]
+  end
+
+  defp new_stream_state(stream) do
+    %{
+      parser: SSE.new(),
+      content: [],
+      metadata: %{},
+      error: nil,
+      on_chunk: stream.on_chunk,
+      coalesce_bytes: stream.coalesce_bytes,
+      coalesce_ms: stream.coalesce_ms,
+      pending: [],
+      pending_bytes: 0,
+      pending_since: nil
+    }
+  end
+
+  defp consume_events(state, data, provider_module, metadata) do
+    {events, parser} = SSE.parse(state.parser, data)
+    apply_events(%{state | parser: parser}, events, provider_module, metadata)
+  end
+
+  defp apply_events(state, events, provider_module, metadata) do
+    Enum.reduce_while(events, state, fn
+      "[DONE]", acc ->
+        {:halt, acc}
+
+      event, acc ->
+        case Jason.decode(event) do
+          {:ok, chunk} when is_map(chunk) ->
+            case provider_module.parse_stream_chunk(chunk, metadata) do
+              {:ok, parsed} ->
+                {:cont, apply_chunk(acc, parsed)}
+
+              {:error, error} ->
+                {:halt, %{acc | error: error}}
+            end
+
+          _ ->
+            # Keep-alive payloads and malformed events carry no content.
+            {:cont, acc}
+        end
+    end)
+  end
+
+  defp apply_chunk(state, %{content: content} = parsed) do
+    state =
+      case content do
+        delta when is_binary(delta) and delta != "" ->
+          emit_delta(%{state | content: [state.content | delta]}, delta)
+
+        _ ->
+          state
+      end
+
+    metadata =
+      parsed
+      |> Map.get(:metadata, %{})
+      |> Enum.reduce(state.metadata, fn
+        {_key, nil}, acc -> acc
+        {key, value}, acc -> Map.put(acc, key, value)
+      end)
+
+    %{state | metadata: metadata}
+  end
+
+  # Deltas are handed to the callback once :coalesce_bytes have accumulated or
+  # the oldest pending delta is :coalesce_ms old, so token-sized events do not
+  # each cost a callback round trip.
+  defp emit_delta(state, delta) do
+    now = if state.coalesce_ms > 0, do: System.monotonic_time(:millisecond)
+
+    state = %{
+      state
+      | pending: [state.pending | delta],
+        pending_bytes: state.pending_bytes + byte_size(delta),
+        pending_since: state.pending_since || now
+    }
+
+    if flush_due?(state, now) do
+      flush_pending(state)
+    else
+      state
+    end
+  end
+
+  defp flush_due?(%{coalesce_bytes: 0, coalesce_ms: 0}, _now), do: true
+
+  defp flush_due?(state, now) do
+    (state.coalesce_bytes > 0 and state.pending_bytes >= state.coalesce_bytes) or
+      (state.coalesce_ms > 0 and now - state.pending_since >= state.coalesce_ms)
+  end
+
+  defp flush_pending(%{pending_bytes: 0} = state), do: state
+
+  defp flush_pending(state) do
+    state.on_chunk.(IO.iodata_to_binary(state.pending))
+    %{state | pending: [], pending_bytes: 0, pending_since: nil}
+  end
+
+  defp finish_stream(%Req.Response{status: status} = response, provider_module, metadata, stream)
+       when status in 200..299 do
+    state = Req.Response.get_private(response, :synapse_stream, new_stream_state(stream))
+
+    # A final event without a trailing blank line is still delivered.
+    {events, parser} = SSE.flush(state.parser)
+
+    state =
+      if state.error do
+        state
+      else
+        apply_events(%{state | parser: parser}, events, provider_module, metadata)
+      end
+
+    case state.error do
+      nil ->
+        state = flush_pending(state)
+        {:ok, %{content: IO.iodata_to_binary(state.content), metadata: state.metadata}}
+
+      error ->
+        {:error, error}
+    end
+  end
+
+  defp finish_stream(%Req.Response{body: body} = response, provider_module, metadata, _stream) do
+    body =
+      case Jason.decode(error_body(body)) do
+        {:ok, decoded} -> decoded
+        {:error, _} -> body
+      end
+
+    provider_module.parse_response(%{response | body: body}, metadata)
+  end
+
+  defp error_body(body) when is_binary(body), do: body
+  defp error_body(_body), do: ""
+
   ## Utility helpers
 
   defp fetch_required(config, key) do
@@ -599,6 +1234,19 @@ defmodule Synapse.ReqLLM do
     end
   end
 
+  # Base requests are cached per profile, so whether the shared pool is running
+  # is decided on every call: a pool that starts or restarts after the request
+  # was built is still picked up.
+  defp finch_options(%Req.Request{options: options}) do
+    custom_pool? = Enum.any?([:finch, :connect_options, :inet6], &Map.has_key?(options, &1))
+
+    if custom_pool? or is_nil(Process.whereis(Synapse.Finch)) do
+      []
+    else
+      [finch: Synapse.Finch]
+    end
+  end
+
   defp maybe_put_kw(list, _key, nil), do: list
   defp maybe_put_kw(list, key, value), do: Keyword.put(list, key, value)
 
@@ -700,25 +1348,16 @@ defmodule Synapse.ReqLLM do
   end
 
   defp determine_provider(profile_config) do
-    case Keyword.get(profile_config, :payload_format) do
-      :google_generate_content -> :gemini
-      :openai -> :openai
-      _ -> :openai
-    end
+    Map.get(@payload_format_providers, Keyword.get(profile_config, :payload_format), :openai)
   end
 
-  defp extract_token_usage(%{metadata: metadata}) when is_map(metadata) do
-    case Map.get(metadata, :total_tokens) do
-      total when is_integer(total) ->
-        %{
-          total_tokens: total,
-          prompt_tokens: nil,
-          completion_tokens: nil
-        }
-
-      _ ->
-        nil
-    end
+  defp extract_token_usage(%{metadata: %{total_tokens: total} = metadata})
+       when is_integer(total) do
+    %{
+      total_tokens: total,
+      prompt_tokens: Map.get(metadata, :prompt_tokens),
+      completion_tokens: Map.get(metadata, :completion_tokens)
+    }
   end
 
   defp extract_token_usage(_), do: nil
@@ -0,0 +1,216 @@
+defmodule Synapse.ReqLLM.CircuitBreaker do
+  @moduledoc """
+  Per-profile circuit breaker that fails LLM requests fast while a provider is
+  unhealthy.
+
+  A profile's circuit opens after `failure_threshold` consecutive failures.
+  While it is open, requests are rejected without being sent. Once
+  `cooldown_ms` has elapsed a single probe request is let through: success
+  closes the circuit, failure opens it for another cooldown. While the circuit
+  is open or half-open only the probe's outcome counts, so requests that were
+  already in flight when it opened cannot close or reopen it.
+
+  Circuit states live in a named ETS table owned by the breaker, so checking a
+  closed circuit is a single lookup and only state transitions reach the
+  process. Probes are monitored, so a prober that exits without reporting an
+  outcome hands the probe to the next caller. When the breaker is not running
+  every request is allowed.
+  """
+
+  use GenServer
+
+  @typedoc "Breaker settings from a profile's `:circuit_breaker` option"
+  @type config :: [failure_threshold: pos_integer(), cooldown_ms: pos_integer()]
+
+  @typedoc "Outcome of a request that was allowed through"
+  @type outcome :: :success | :failure | :neutral
+
+  @doc """
+  Starts the breaker. `:name` must be an atom; it also names the ETS table.
+  """
+  @spec start_link(keyword()) :: GenServer.on_start()
+  def start_link(opts \\ []) do
+    name = Keyword.get(opts, :name, __MODULE__)
+    GenServer.start_link(__MODULE__, name, name: name)
+  end
+
+  @doc """
+  Checks whether a request for `key` may be sent.
+
+  Returns `{:error, :open}` while the circuit is open or another caller holds
+  the probe. A caller that is allowed through must report the outcome with
+  `record/4`.
+  """
+  @spec allow(atom(), term()) :: :ok | {:error, :open}
+  def allow(server \\ __MODULE__, key) do
+    case lookup(server, key) do
+      {:closed, _failures} ->
+        :ok
+
+      {:open, retry_at} ->
+        if now() >= retry_at, do: probe(server, key), else: {:error, :open}
+
+      {:half_open, _ref, _pid} ->
+        {:error, :open}
+    end
+  end
+
+  @doc """
+  Records the outcome of a request that `allow/2` let through.
+
+  `:neutral` means the request ended without saying anything about the
+  provider's health (for example a 4xx response, or the caller raised); it
+  leaves the failure count unchanged and only releases a held probe.
+  """
+  @spec record(atom(), term(), outcome(), config()) :: :ok
+  def record(server \\ __MODULE__, key, outcome, config)
+
+  def record(server, key, :success, _config) do
+    case lookup(server, key) do
+      {:closed, 0} -> :ok
+      _state -> GenServer.cast(server, {:success, key, self()})
+    end
+  end
+
+  def record(server, key, :failure, config) do
+    threshold = Keyword.get(config, :failure_threshold, 5)
+    cooldown = Keyword.get(config, :cooldown_ms, 30_000)
+    GenServer.cast(server, {:failure, key, self(), threshold, cooldown})
+  end
+
+  def record(server, key, :neutral, _config) do
+    case lookup(server, key) do
+      {:half_open, _ref, pid} when pid == self() -> GenServer.cast(server, {:neutral, key, pid})
+      _state -> :ok
+    end
+  end
+
+  ## Server callbacks
+
+  @impl true
+  def init(name) do
+    # table rows: {key, {:closed, failures} | {:open, retry_at} | {:half_open, ref, pid}}
+    # probes: %{monitor_ref => key}
+    table = :ets.new(name, [:set, :protected, :named_table, read_concurrency: true])
+    {:ok, %{table: table, probes: %{}}}
+  end
+
+  @impl true
+  def handle_call({:probe, key}, {pid, _tag}, state) do
+    case fetch(state, key) do
+      {:open, retry_at} ->
+        if now() >= retry_at do
+          ref = Process.monitor(pid)
+          :ets.insert(state.table, {key, {:half_open, ref, pid}})
+          {:reply, :ok, %{state | probes: Map.put(state.probes, ref, key)}}
+        else
+          {:reply, {:error, :open}, state}
+        end
+
+      {:closed, _failures} ->
+        {:reply, :ok, state}
+
+      {:half_open, _ref, _pid} ->
+        {:reply, {:error, :open}, state}
+    end
+  end
+
+  @impl true
+  def handle_cast({:success, key, pid}, state) do
+    case fetch(state, key) do
+      {:closed, _failures} ->
+        :ets.delete(state.table, key)
+        {:noreply, state}
+
+      {:half_open, _ref, ^pid} ->
+        state = drop_probe(state, key)
+        :ets.delete(state.table, key)
+        {:noreply, state}
+
+      _open_or_probed_by_another ->
+        {:noreply, state}
+    end
+  end
+
+  def handle_cast({:failure, key, pid, threshold, cooldown}, state) do
+    case fetch(state, key) do
+      {:closed, failures} when failures + 1 < threshold ->
+        :ets.insert(state.table, {key, {:closed, failures + 1}})
+        {:noreply, state}
+
+      {:closed, _failures} ->
+        :ets.insert(state.table, {key, {:open, now() + cooldown}})
+        {:noreply, state}
+
+      {:half_open, _ref, ^pid} ->
+        state = drop_probe(state, key)
+        :ets.insert(state.table, {key, {:open, now() + cooldown}})
+        {:noreply, state}
+
+      _open_or_probed_by_another ->
+        {:noreply, state}
+    end
+  end
+
+  def handle_cast({:neutral, key, pid}, state) do
+    case fetch(state, key) do
+      {:half_open, _ref, ^pid} ->
+        state = drop_probe(state, key)
+        :ets.insert(state.table, {key, {:open, now()}})
+        {:noreply, state}
+
+      _other ->
+        {:noreply, state}
+    end
+  end
+
+  @impl true
+  def handle_info({:DOWN, ref, :process, _pid, _reason}, state) do
+    case Map.pop(state.probes, ref) do
+      {nil, _probes} ->
+        {:noreply, state}
+
+      {key, probes} ->
+        # The prober never reported back; let the next caller probe right away.
+        :ets.insert(state.table, {key, {:open, now()}})
+        {:noreply, %{state | probes: probes}}
+    end
+  end
+
+  ## Internal helpers
+
+  defp probe(server, key) do
+    GenServer.call(server, {:probe, key})
+  catch
+    :exit, _reason -> :ok
+  end
+
+  defp lookup(server, key) do
+    case :ets.lookup(server, key) do
+      [{^key, circuit}] -> circuit
+      [] -> {:closed, 0}
+    end
+  rescue
+    ArgumentError -> {:closed, 0}
+  end
+
+  defp fetch(state, key) do
+    case :ets.lookup(state.table, key) do
+      [{^key, circuit}] -> circuit
+      [] -> {:closed, 0}
+    end
+  end
+
+  defp drop_probe(state, key) do
+    case fetch(state, key) do
+      {:half_open, ref, _pid} ->
+        Process.demonitor(ref, [:flush])
+        %{state | probes: Map.delete(state.probes, ref)}
+
+      _other ->
+        state
+    end
+  end
+
+  defp now, do: System.monotonic_time(:millisecond)
+end
@@ -0,0 +1,192 @@
+defmodule Synapse.ReqLLM.Limiter do
+  @moduledoc """
+  Counting semaphore that bounds in-flight LLM requests per profile.
+
+  Callers acquire a slot before issuing a request and release it afterwards.
+  When a profile is saturated, callers wait in FIFO order for up to the given
+  timeout instead of piling more requests onto a throttled provider. Holders
+  and waiters are monitored, so a caller that crashes or is killed mid-request
+  never leaks its slot.
+  """
+
+  use GenServer
+
+  @typedoc "Token returned by `acquire/4` and handed back to `release/2`"
+  @type token :: reference() | nil
+
+  @doc """
+  Starts the limiter.
+  """
+  @spec start_link(keyword()) :: GenServer.on_start()
+  def start_link(opts \\ []) do
+    GenServer.start_link(__MODULE__, :ok, name: Keyword.get(opts, :name, __MODULE__))
+  end
+
+  @doc """
+  Acquires a slot for `key`, allowing at most `max` concurrent holders.
+
+  Waits up to `timeout` milliseconds (`0` fails immediately) and returns
+  `{:error, :timeout}` if no slot frees up. When the limiter is not running the
+  call is allowed through with a `nil` token.
+  """
+  @spec acquire(GenServer.server(), term(), pos_integer(), non_neg_integer()) ::
+          {:ok, token()} | {:error, :timeout}
+  def acquire(server \\ __MODULE__, key, max, timeout) do
+    case GenServer.whereis(server) do
+      nil ->
+        {:ok, nil}
+
+      pid ->
+        try do
+          GenServer.call(pid, {:acquire, key, max, timeout}, :infinity)
+        catch
+          :exit, _reason -> {:ok, nil}
+        end
+    end
+  end
+
+  @doc """
+  Releases a slot previously returned by `acquire/4`.
+  """
+  @spec release(GenServer.server(), token()) :: :ok
+  def release(server \\ __MODULE__, token)
+
+  def release(_server, nil), do: :ok
+
+  def release(server, token) when is_reference(token) do
+    GenServer.cast(server, {:release, token})
+  end
+
+  ## Server callbacks
+
+  @impl true
+  def init(:ok) do
+    # counts: %{key => holder_count}
+    # holders: %{monitor_ref => key}
+    # waiting: %{monitor_ref => {key, max, from, timer_ref}}
+    # queues: %{key => :queue.queue(monitor_ref)}
+    {:ok, %{counts: %{}, holders: %{}, waiting: %{}, queues: %{}}}
+  end
+
+  @impl true
+  def handle_call({:acquire, key, max, timeout}, {pid, _tag} = from, state) do
+    ref = Process.monitor(pid)
+
+    cond do
+      Map.get(state.counts, key, 0) < max ->
+        {:reply, {:ok, ref}, grant(state, key, ref)}
+
+      timeout == 0 ->
+        Process.demonitor(ref, [:flush])
+        {:reply, {:error, :timeout}, state}
+
+      true ->
+        timer = Process.send_after(self(), {:expire, ref}, timeout)
+        queue = Map.get(state.queues, key, :queue.new())
+
+        state = %{
+          state
+          | waiting: Map.put(state.waiting, ref, {key, max, from, timer}),
+            queues: Map.put(state.queues, key, :queue.in(ref, queue))
+        }
+
+        {:noreply, state}
+    end
+  end
+
+  @impl true
+  def handle_cast({:release, ref}, state) do
+    case Map.pop(state.holders, ref) do
+      {nil, _holders} ->
+        {:noreply, state}
+
+      {key, holders} ->
+        Process.demonitor(ref, [:flush])
+        {:noreply, free_slot(%{state | holders: holders}, key)}
+    end
+  end
+
+  @impl true
+  def handle_info({:expire, ref}, state) do
+    case Map.pop(state.waiting, ref) do
+      {nil, _waiting} ->
+        {:noreply, state}
+
+      {{_key, _max, from, _timer}, waiting} ->
+        Process.demonitor(ref, [:flush])
+        GenServer.reply(from, {:error, :timeout})
+        {:noreply, %{state | waiting: waiting}}
+    end
+  end
+
+  def handle_info({:DOWN, ref, :process, _pid, _reason}, state) do
+    cond do
+      Map.has_key?(state.holders, ref) ->
+        {key, holders} = Map.pop(state.holders, ref)
+        {:noreply, free_slot(%{state | holders: holders}, key)}
+
+      Map.has_key?(state.waiting, ref) ->
+        {{_key, _max, _from, timer}, waiting} = Map.pop(state.waiting, ref)
+        Process.cancel_timer(timer)
+        {:noreply, %{state | waiting: waiting}}
+
+      true ->
+        {:noreply, state}
+    end
+  end
+
+  ## Internal helpers
+
+  defp grant(state, key, ref) do
+    %{
+      state
+      | counts: Map.update(state.counts, key, 1, &(&1 + 1)),
+        holders: Map.put(state.holders, ref, key)
+    }
+  end
+
+  defp free_slot(state, key) do
+    counts =
+      case Map.get(state.counts, key, 0) do
+        count when count <= 1 -> Map.delete(state.counts, key)
+        count -> Map.put(state.counts, key, count - 1)
+      end
+
+    grant_next(%{state | counts: counts}, key)
+  end
+
+  # Queues are cleaned lazily: entries for waiters that expired or exited are
+  # skipped here rather than searched for when they leave.
+  defp grant_next(state, key) do
+    queue = Map.get(state.queues, key, :queue.new())
+
+    case :queue.out(queue) do
+      {:empty, _queue} ->
+        %{state | queues: Map.delete(state.queues, key)}
+
+      {{:value, ref}, rest} ->
+        state = %{state | queues: Map.put(state.queues, key, rest)}
+
+        case Map.pop(state.waiting, ref) do
+          {nil, _waiting} ->
+            grant_next(state, key)
+
+          {{^key, max, from, timer}, waiting} ->
+            state = %{state | waiting: waiting}
+
+            if Map.get(state.counts, key, 0) < max do
+              Process.cancel_timer(timer)
+              GenServer.reply(from, {:ok, ref})
+              grant(state, key, ref)
+            else
+              # Keep the waiter at the head of the line for the next release.
+              %{
+                state
+                | waiting: Map.put(waiting, ref, {key, max, from, timer}),
+                  queues: Map.put(state.queues, key, :queue.in_r(ref, rest))
+              }
+            end
+        end
+    end
+  end
+end
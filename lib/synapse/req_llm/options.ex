@@ -5,33 +5,208 @@ defmodule Synapse.ReqLLM.Options do
   Provides compile-time validated configuration with auto-generated documentation.
   """
 
+  @retry_schema [
+    enabled: [
+      type: :boolean,
+      default: true,
+      doc: "Enable or disable automatic retries for transient failures"
+    ],
+    max_attempts: [
+      type: :pos_integer,
+      default: 3,
+      doc: "Total number of attempts including the initial request (must be >= 1)"
+    ],
+    base_backoff_ms: [
+      type: :pos_integer,
+      default: 300,
+      doc: "Base backoff delay in milliseconds for exponential backoff"
+    ],
+    max_backoff_ms: [
+      type: :pos_integer,
+      default: 5_000,
+      doc: "Maximum backoff delay in milliseconds (caps exponential growth)"
+    ]
+  ]
+
+  @concurrency_schema [
+    max_in_flight: [
+      type: :pos_integer,
+      required: true,
+      doc: "Maximum number of concurrent requests issued through the profile"
+    ],
+    queue_timeout_ms: [
+      type: :non_neg_integer,
+      default: 5_000,
+      doc: "How long a caller waits for a free slot before failing (0 fails immediately)"
+    ]
+  ]
+
+  @circuit_breaker_schema [
+    failure_threshold: [
+      type: :pos_integer,
+      default: 5,
+      doc: "Consecutive provider failures that open the circuit"
+    ],
+    cooldown_ms: [
+      type: :pos_integer,
+      default: 30_000,
+      doc: "How long requests are rejected before a single probe request is allowed"
+    ]
+  ]
+
+  @response_cache_schema [
+    ttl_ms: [
+      type: :pos_integer,
+      default: 300_000,
+      doc: "How long a cached completion is served"
+    ],
+    max_entries: [
+      type: :pos_integer,
+      default: 1_024,
+      doc: "Cache size above which new completions are not cached until expired ones are swept"
+    ]
+  ]
+
+  @profile_schema [
+    base_url: [
+      type: :string,
+      required: true,
+      doc: "Base URL for the LLM provider API (e.g., 'https://api.openai.com')"
+    ],
+    api_key: [
+      type: :string,
+      required: true,
+      doc: "API key or authentication token for the provider"
+    ],
+    model: [
+      type: :string,
+      doc: "Default model to use for this profile (e.g., 'gpt-4o-mini')"
+    ],
+    allowed_models: [
+      type: {:list, :string},
+      doc: "Whitelist of allowed models for this profile (validates model param)"
+    ],
+    system_prompt: [
+      type: :string,
+      doc: "Profile-specific system prompt (overrides global system_prompt)"
+    ],
+    endpoint: [
+      type: :string,
+      default: "/v1/chat/completions",
+      doc:
+        "API endpoint path (supports {model} placeholder, e.g., '/v1beta/models/{model}:generateContent')"
+    ],
+    payload_format: [
+      type: :atom,
+      doc:
+        "Legacy payload format identifier (:openai, :google_generate_content). Prefer :provider_module."
+    ],
+    provider_module: [
+      type: :atom,
+      doc:
+        "Provider module implementing Synapse.LLMProvider behaviour (e.g., Synapse.Providers.OpenAI)"
+    ],
+    auth_header: [
+      type: :string,
+      default: "authorization",
+      doc: "HTTP header name for authentication (e.g., 'x-goog-api-key' for Gemini)"
+    ],
+    auth_header_prefix: [
+      type: {:or, [:string, nil]},
+      default: "Bearer ",
+      doc: "Prefix for auth header value (e.g., 'Bearer ' for OpenAI, nil for Gemini)"
+    ],
+    temperature: [
+      type: {:or, [:float, :integer]},
+      doc: "Default temperature for completions (0.0-2.0, provider-dependent)"
+    ],
+    max_tokens: [
+      type: :pos_integer,
+      doc: "Default maximum tokens to generate"
+    ],
+    max_prompt_bytes: [
+      type: :pos_integer,
+      doc: "Rejects requests whose prompt and message content exceed this many bytes"
+    ],
+    retry: [
+      type: :keyword_list,
+      keys: @retry_schema,
+      default: [],
+      doc: "Retry configuration for transient failures (408, 429, 5xx)"
+    ],
+    concurrency: [
+      type: :keyword_list,
+      keys: @concurrency_schema,
+      doc: "Caps in-flight requests for the profile; unlimited when omitted"
+    ],
+    circuit_breaker: [
+      type: :keyword_list,
+      keys: @circuit_breaker_schema,
+      doc: "Fails requests fast after repeated provider failures; disabled when omitted"
+    ],
+    response_cache: [
+      type: :keyword_list,
+      keys: @response_cache_schema,
+      doc: "Serves identical non-streaming requests from a TTL cache; disabled when omitted"
+    ],
+    req_options: [
+      type: :keyword_list,
+      default: [],
+      doc: "Additional Req HTTP client options (timeouts, etc.). Accepts any valid Req options."
+    ],
+    plug: [
+      type: {:tuple, [:atom, :atom]},
+      doc: "Req.Test plug for testing (internal use)"
+    ],
+    plug_owner: [
+      type: :pid,
+      doc: "Req.Test plug owner PID (internal use)"
+    ]
+  ]
+
+  @global_schema [
+    profiles: [
+      type: :keyword_list,
+      required: true,
+      doc: "Map of profile names to profile configurations"
+    ],
+    default_profile: [
+      type: :atom,
+      doc: "Default profile to use when not specified in request options"
+    ],
+    system_prompt: [
+      type: :string,
+      doc: "Global fallback system prompt used when profile doesn't specify one"
+    ],
+    default_model: [
+      type: :string,
+      doc: "Global fallback model when neither profile nor request specifies one"
+    ]
+  ]
+
+  # Compiled once at build time so validation skips NimbleOptions' schema checks.
+  @compiled_profile_schema NimbleOptions.new!(@profile_schema)
+  @compiled_global_schema NimbleOptions.new!(@global_schema)
+
   @doc """
   Schema for retry configuration within a profile.
   """
-  def retry_schema do
-    [
-      enabled: [
-        type: :boolean,
-        default: true,
-        doc: "Enable or disable automatic retries for transient failures"
-      ],
-      max_attempts: [
-        type: :pos_integer,
-        default: 3,
-        doc: "Total number of attempts including the initial request (must be >= 1)"
-      ],
-      base_backoff_ms: [
-        type: :pos_integer,
-        default: 300,
-        doc: "Base backoff delay in milliseconds for exponential backoff"
-      ],
-      max_backoff_ms: [
-        type: :pos_integer,
-        default: 5_000,
-        doc: "Maximum backoff delay in milliseconds (caps exponential growth)"
-      ]
-    ]
-  end
+  def retry_schema, do: @retry_schema
+
+  @doc """
+  Schema for concurrency limits within a profile.
+  """
+  def concurrency_schema, do: @concurrency_schema
+
+  @doc """
+  Schema for circuit breaker settings within a profile.
+  """
+  def circuit_breaker_schema, do: @circuit_breaker_schema
+
+  @doc """
+  Schema for response caching within a profile.
+  """
+  def response_cache_schema, do: @response_cache_schema
 
   @doc """
   Schema for req_options within a profile.
@@ -47,110 +222,12 @@ defmodule Synapse.ReqLLM.Options do
   @doc """
   Schema for an individual profile configuration.
   """
-  def profile_schema do
-    [
-      base_url: [
-        type: :string,
-        required: true,
-        doc: "Base URL for the LLM provider API (e.g., 'https://api.openai.com')"
-      ],
-      api_key: [
-        type: :string,
-        required: true,
-        doc: "API key or authentication token for the provider"
-      ],
-      model: [
-        type: :string,
-        doc: "Default model to use for this profile (e.g., 'gpt-4o-mini')"
-      ],
-      allowed_models: [
-        type: {:list, :string},
-        doc: "Whitelist of allowed models for this profile (validates model param)"
-      ],
-      system_prompt: [
-        type: :string,
-        doc: "Profile-specific system prompt (overrides global system_prompt)"
-      ],
-      endpoint: [
-        type: :string,
-        default: "/v1/chat/completions",
-        doc:
-          "API endpoint path (supports {model} placeholder, e.g., '/v1beta/models/{model}:generateContent')"
-      ],
-      payload_format: [
-        type: :atom,
-        doc:
-          "Legacy payload format identifier (:openai, :google_generate_content). Prefer :provider_module."
-      ],
-      provider_module: [
-        type: :atom,
-        doc:
-          "Provider module implementing Synapse.LLMProvider behaviour (e.g., Synapse.Providers.OpenAI)"
-      ],
-      auth_header: [
-        type: :string,
-        default: "authorization",
-        doc: "HTTP header name for authentication (e.g., 'x-goog-api-key' for Gemini)"
-      ],
-      auth_header_prefix: [
-        type: {:or, [:string, nil]},
-        default: "Bearer ",
-        doc: "Prefix for auth header value (e.g., 'Bearer ' for OpenAI, nil for Gemini)"
-      ],
-      temperature: [
-        type: {:or, [:float, :integer]},
-        doc: "Default temperature for completions (0.0-2.0, provider-dependent)"
-      ],
-      max_tokens: [
-        type: :pos_integer,
-        doc: "Default maximum tokens to generate"
-      ],
-      retry: [
-        type: :keyword_list,
-        keys: retry_schema(),
-        default: [],
-        doc: "Retry configuration for transient failures (408, 429, 5xx)"
-      ],
-      req_options: [
-        type: :keyword_list,
-        default: [],
-        doc: "Additional Req HTTP client options (timeouts, etc.). Accepts any valid Req options."
-      ],
-      plug: [
-        type: {:tuple, [:atom, :atom]},
-        doc: "Req.Test plug for testing (internal use)"
-      ],
-      plug_owner: [
-        type: :pid,
-        doc: "Req.Test plug owner PID (internal use)"
-      ]
-    ]
-  end
+  def profile_schema, do: @profile_schema
 
   @doc """
   Schema for global ReqLLM configuration.
   """
-  def global_schema do
-    [
-      profiles: [
-        type: :keyword_list,
-        required: true,
-        doc: "Map of profile names to profile configurations"
-      ],
-      default_profile: [
-        type: :atom,
-        doc: "Default profile to use when not specified in request options"
-      ],
-      system_prompt: [
-        type: :string,
-        doc: "Global fallback system prompt used when profile doesn't specify one"
-      ],
-      default_model: [
-        type: :string,
-        doc: "Global fallback model when neither profile nor request specifies one"
-      ]
-    ]
-  end
+  def global_schema, do: @global_schema
 
   @doc """
   Validates global configuration using NimbleOptions.
@@ -158,7 +235,7 @@ defmodule Synapse.ReqLLM.Options do
   Returns `{:ok, validated_config}` or `{:error, %NimbleOptions.ValidationError{}}`.
   """
   def validate_global(config) when is_list(config) do
-    case NimbleOptions.validate(config, global_schema()) do
+    case NimbleOptions.validate(config, @compiled_global_schema) do
       {:ok, validated} ->
         # Validate each profile
         validate_profiles(validated)
@@ -198,7 +275,7 @@ defmodule Synapse.ReqLLM.Options do
   Validates a single profile configuration.
   """
   def validate_profile(profile_config) when is_list(profile_config) do
-    NimbleOptions.validate(profile_config, profile_schema())
+    NimbleOptions.validate(profile_config, @compiled_profile_schema)
   end
 
   def validate_profile(profile_config) do
@@ -260,6 +337,24 @@ defmodule Synapse.ReqLLM.Options do
 
     #{NimbleOptions.docs(retry_schema())}
 
+    ## Concurrency Options
+
+    Within a profile's `:concurrency` configuration:
+
+    #{NimbleOptions.docs(concurrency_schema())}
+
+    ## Circuit Breaker Options
+
+    Within a profile's `:circuit_breaker` configuration:
+
+    #{NimbleOptions.docs(circuit_breaker_schema())}
+
+    ## Response Cache Options
+
+    Within a profile's `:response_cache` configuration:
+
+    #{NimbleOptions.docs(response_cache_schema())}
+
     ## Example Configuration
 
     ```elixir
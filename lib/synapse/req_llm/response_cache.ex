@@ -0,0 +1,86 @@
+defmodule Synapse.ReqLLM.ResponseCache do
+  @moduledoc """
+  TTL cache for chat completion results of profiles that opt in with
+  `:response_cache`.
+
+  Entries are keyed by the full request term and live in a named public ETS
+  table, so lookups and inserts run in the calling process. The owning process
+  only sweeps expired entries once the table reaches a profile's
+  `max_entries`; until space frees up, new results are simply not cached.
+  When the cache is not running every lookup misses.
+  """
+
+  use GenServer
+
+  @typedoc "Cache settings from a profile's `:response_cache` option"
+  @type config :: [ttl_ms: pos_integer(), max_entries: pos_integer()]
+
+  @doc """
+  Starts the cache. `:name` must be an atom; it also names the ETS table.
+  """
+  @spec start_link(keyword()) :: GenServer.on_start()
+  def start_link(opts \\ []) do
+    name = Keyword.get(opts, :name, __MODULE__)
+    GenServer.start_link(__MODULE__, name, name: name)
+  end
+
+  @doc """
+  Returns the cached value for `key` unless it is missing or expired.
+  """
+  @spec fetch(atom(), term()) :: {:ok, term()} | :error
+  def fetch(cache \\ __MODULE__, key) do
+    case :ets.lookup(cache, key) do
+      [{^key, expires_at, value}] ->
+        if now() < expires_at, do: {:ok, value}, else: :error
+
+      [] ->
+        :error
+    end
+  rescue
+    ArgumentError -> :error
+  end
+
+  @doc """
+  Caches `value` under `key` for the configured TTL.
+  """
+  @spec put(atom(), term(), term(), config()) :: :ok
+  def put(cache \\ __MODULE__, key, value, config) do
+    ttl = Keyword.get(config, :ttl_ms, 300_000)
+    max_entries = Keyword.get(config, :max_entries, 1_024)
+
+    if :ets.info(cache, :size) < max_entries do
+      :ets.insert(cache, {key, now() + ttl, value})
+    else
+      GenServer.cast(cache, :sweep)
+    end
+
+    :ok
+  rescue
+    ArgumentError -> :ok
+  end
+
+  ## Server callbacks
+
+  @impl true
+  def init(name) do
+    table =
+      :ets.new(name, [
+        :set,
+        :public,
+        :named_table,
+        read_concurrency: true,
+        write_concurrency: true
+      ])
+
+    {:ok, %{table: table}}
+  end
+
+  @impl true
+  def handle_cast(:sweep, state) do
+    now = now()
+    :ets.select_delete(state.table, [{{:_, :"$1", :_}, [{:"=<", :"$1", now}], [true]}])
+    {:noreply, state}
+  end
+
+  defp now, do: System.monotonic_time(:millisecond)
+end
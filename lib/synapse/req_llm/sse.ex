@@ -0,0 +1,90 @@
+defmodule Synapse.ReqLLM.SSE do
+  @moduledoc """
+  Incremental parser for `text/event-stream` response bodies.
+
+  Chunks arrive at arbitrary byte boundaries, so the parser keeps the trailing
+  partial event between calls and only returns the `data` payload of events that
+  are complete. Comments and the `event`, `id`, and `retry` fields are ignored.
+  """
+
+  @type t :: %__MODULE__{buffer: binary()}
+
+  defstruct buffer: ""
+
+  @patterns_key {__MODULE__, :patterns}
+
+  @doc """
+  Returns an empty parser.
+  """
+  @spec new() :: t()
+  def new, do: %__MODULE__{}
+
+  @doc """
+  Feeds a chunk of the body and returns the data of every completed event.
+  """
+  @spec parse(t(), binary()) :: {[String.t()], t()}
+  def parse(%__MODULE__{buffer: buffer} = parser, chunk) when is_binary(chunk) do
+    # Every event terminator ends in a newline, so a chunk without one cannot
+    # complete an event and the buffer does not need to be rescanned.
+    case :binary.match(chunk, "\n") do
+      :nomatch -> {[], %{parser | buffer: buffer <> chunk}}
+      _match -> split_events(parser, buffer <> chunk)
+    end
+  end
+
+  defp split_events(parser, buffer) do
+    [rest | complete] =
+      buffer
+      |> :binary.split(patterns().event, [:global])
+      |> Enum.reverse()
+
+    data =
+      complete
+      |> Enum.reverse()
+      |> Enum.flat_map(&event_data/1)
+
+    {data, %{parser | buffer: rest}}
+  end
+
+  @doc """
+  Returns the data of a final event that was not terminated by a blank line.
+  """
+  @spec flush(t()) :: {[String.t()], t()}
+  def flush(%__MODULE__{buffer: buffer}) do
+    {event_data(buffer), new()}
+  end
+
+  defp event_data(event) do
+    event
+    |> :binary.split(patterns().line, [:global])
+    |> Enum.flat_map(fn
+      "data:" <> value -> [strip_leading_space(value)]
+      _other -> []
+    end)
+    |> case do
+      [] -> []
+      lines -> [Enum.join(lines, "\n")]
+    end
+  end
+
+  # Compiled patterns are references and cannot live in module attributes, so
+  # they are built once per node and kept in persistent_term.
+  defp patterns do
+    case :persistent_term.get(@patterns_key, nil) do
+      nil ->
+        patterns = %{
+          event: :binary.compile_pattern(["\r\n\r\n", "\n\n"]),
+          line: :binary.compile_pattern(["\r\n", "\n"])
+        }
+
+        :persistent_term.put(@patterns_key, patterns)
+        patterns
+
+      patterns ->
+        patterns
+    end
+  end
+
+  defp strip_leading_space(" " <> value), do: value
+  defp strip_leading_space(value), do: value
+end
@@ -75,6 +75,35 @@ defmodule Synapse.Runtime do
     end
   end
 
+  @doc """
+  Cheap liveness probe for health endpoints.
+
+  Checks that the runtime supervisor and its router, registry, and specialist
+  supervisor are registered and alive, without sending any of them a message
+  or touching the LLM path. Returns `false` when the runtime was never
+  started.
+  """
+  @spec healthy?(atom()) :: boolean()
+  def healthy?(name \\ @default_name) do
+    case :persistent_term.get(runtime_key(name), :not_found) do
+      :not_found ->
+        false
+
+      %__MODULE__{} = runtime ->
+        Enum.all?(
+          [runtime.name, runtime.router, runtime.registry, runtime.specialist_supervisor],
+          &alive?/1
+        )
+    end
+  end
+
+  defp alive?(name) do
+    case Process.whereis(name) do
+      nil -> false
+      pid -> Process.alive?(pid)
+    end
+  end
+
   defp build_runtime(name, opts) do
     runtime_id = Keyword.get(opts, :runtime_id, System.unique_integer([:positive]))
     router_name = Keyword.get(opts, :router_name, :"#{name}_router_#{runtime_id}")
@@ -174,12 +174,21 @@ defmodule Synapse.Signal.Registry do
 
   ## Helpers
 
+  # The table handles live in persistent_term, so the common case is a single
+  # constant-time read; the registry process is only consulted (and lazily
+  # started for the default name) when no handles have been published yet.
   defp fetch_tables(registry) do
-    ensure_started(registry)
-
     case :persistent_term.get(pt_key(registry), :not_found) do
-      :not_found -> {:error, :not_started}
-      tables -> {:ok, tables}
+      :not_found ->
+        ensure_started(registry)
+
+        case :persistent_term.get(pt_key(registry), :not_found) do
+          :not_found -> {:error, :not_started}
+          tables -> {:ok, tables}
+        end
+
+      tables ->
+        {:ok, tables}
     end
   end
 
@@ -271,20 +280,28 @@ defmodule Synapse.Signal.Registry do
 
           {:error, :missing_register} ->
             Logger.warning(
-              "Domain #{inspect(domain)} is configured but does not implement register/0 or register/1"
+              "Domain is configured but does not implement register/0 or register/1",
+              signal_domain: inspect(domain)
             )
 
           {:error, reason} ->
-            Logger.warning("Failed to register domain #{inspect(domain)}: #{inspect(reason)}")
+            Logger.warning("Failed to register domain",
+              signal_domain: inspect(domain),
+              reason: inspect(reason)
+            )
 
           other ->
-            Logger.warning(
-              "Domain #{inspect(domain)} returned unexpected value from register: #{inspect(other)}"
+            Logger.warning("Domain returned unexpected value from register",
+              signal_domain: inspect(domain),
+              reason: inspect(other)
             )
         end
 
       {:error, reason} ->
-        Logger.warning("Failed to load domain #{inspect(domain)}: #{inspect(reason)}")
+        Logger.warning("Failed to load domain",
+          signal_domain: inspect(domain),
+          reason: inspect(reason)
+        )
     end
   end
 
@@ -366,7 +383,7 @@ defmodule Synapse.Signal.Registry do
      %{
        compiled: compiled,
        raw: schema,
-       validator: Schema.compile_schema(schema)
+       validator: Schema.compile_schema(compiled)
      }}
   rescue
     e in NimbleOptions.ValidationError ->
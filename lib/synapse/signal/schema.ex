@@ -49,11 +49,18 @@ defmodule Synapse.Signal.Schema do
 
   @doc """
   Creates a validator function from a NimbleOptions schema definition.
+
+  Accepts either a keyword schema or one already compiled with
+  `NimbleOptions.new!/1`.
   """
-  @spec compile_schema(keyword()) :: (map() -> map())
+  @spec compile_schema(keyword() | NimbleOptions.t()) :: (map() -> map())
   def compile_schema(schema_def) when is_list(schema_def) do
-    compiled = NimbleOptions.new!(schema_def)
+    schema_def
+    |> NimbleOptions.new!()
+    |> compile_schema()
+  end
 
+  def compile_schema(%NimbleOptions{} = compiled) do
     fn payload ->
       try do
         payload
@@ -85,6 +85,36 @@ defmodule Synapse.SignalRouter do
     end
   end
 
+  @doc """
+  Publishes several payloads for the same topic in a single bus call.
+
+  Every payload is validated before anything is published, so an invalid
+  payload raises without emitting any of the batch. Accepts the same options as
+  `publish/4`, applied to each signal.
+  """
+  @spec publish_many(atom(), Signal.topic(), [map()], keyword()) ::
+          {:ok, [JidoSignal.t()]} | {:error, term()}
+  def publish_many(router \\ __MODULE__, topic, payloads, opts \\ [])
+
+  def publish_many(_router, _topic, [], _opts), do: {:ok, []}
+
+  def publish_many(router, topic, payloads, opts) when is_list(payloads) do
+    %{bus: bus, name: router_name} = fetch(router)
+
+    signals = Enum.map(payloads, &build_signal(topic, &1, opts))
+
+    :telemetry.execute(
+      [:synapse, :signal_router, :publish],
+      %{count: length(signals)},
+      %{topic: topic, router: router_name}
+    )
+
+    case SignalBus.publish(bus, signals) do
+      {:ok, _records} -> {:ok, signals}
+      {:error, reason} -> {:error, reason}
+    end
+  end
+
   @doc """
   Subscribes the caller (or provided `:target`) to a validated topic stream.
   """
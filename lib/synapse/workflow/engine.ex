@@ -5,6 +5,19 @@ defmodule Synapse.Workflow.Engine do
   The engine evaluates dependencies, handles step-level retries, emits
   telemetry (`[:synapse, :workflow, :step, :*]`), and surfaces structured
   audit trails for both success and failure scenarios.
+
+  ## Concurrency
+
+  Steps run one at a time by default. Passing `max_concurrency: n` (or setting
+  it under `config :synapse, Synapse.Workflow.Engine`) runs up to `n`
+  independent ready steps at once, which lets IO-bound steps such as LLM calls
+  overlap instead of queueing behind each other. Every step in a concurrent
+  batch runs to completion before any outcome is applied, so a failing step
+  never cuts a sibling's side effects off halfway. Results, audit entries, and
+  snapshots are then applied in declaration order; when a step fails without
+  `on_error: :continue`, the outcomes of the siblings declared after it are
+  discarded. A step whose params fail to resolve fails like any other step in
+  either mode.
   """
 
   alias Jido.Exec
@@ -31,6 +44,15 @@ defmodule Synapse.Workflow.Engine do
 
   @doc """
   Executes a workflow spec with the provided `:input` and `:context` maps.
+
+  ## Options
+
+    * `:input` - workflow input map (default: `%{}`)
+    * `:context` - context map passed to every action (default: `%{}`)
+    * `:persistence` - `{module, opts}` used to persist snapshots
+    * `:request_id` - identifier used for persisted snapshots
+    * `:max_concurrency` - maximum number of independent steps executed at
+      once (default: `1`)
   """
   @spec execute(Spec.t(), keyword()) :: {:ok, success_t()} | {:error, failure_t()}
   def execute(%Spec{} = spec, opts \\ []) do
@@ -40,14 +62,19 @@ defmodule Synapse.Workflow.Engine do
     persistence = normalize_persistence(persistence_opt)
     request_id = resolve_request_id(context, opts)
 
+    max_concurrency =
+      Keyword.get(opts, :max_concurrency, Keyword.get(engine_config, :max_concurrency, 1))
+
     if persistence && is_nil(request_id) do
       raise ArgumentError,
             "workflow persistence requires a :request_id in the context or options"
     end
 
+    input = Keyword.get(opts, :input, %{})
+
     state = %{
       spec: spec,
-      input: Keyword.get(opts, :input, %{}),
+      input: input,
       context: context,
       remaining_steps: spec.steps,
       completed: MapSet.new(),
@@ -56,7 +83,9 @@ defmodule Synapse.Workflow.Engine do
       started_at: DateTime.utc_now(),
       persistence: persistence,
       request_id: request_id,
-      spec_version: spec_version(spec)
+      spec_version: spec_version(spec),
+      max_concurrency: max_concurrency,
+      snapshot_parts: init_snapshot_parts(persistence, input, context)
     }
 
     persist_state(state, :pending)
@@ -90,6 +119,29 @@ defmodule Synapse.Workflow.Engine do
     end
   end
 
+  defp execute_ready_steps(%{max_concurrency: max} = state, [_, _ | _] = ready_steps)
+       when max > 1 do
+    ready_steps
+    |> Task.async_stream(&{&1, run_step(&1, state, 1)},
+      max_concurrency: max,
+      ordered: true,
+      timeout: :infinity
+    )
+    # Drain the stream first: halting it early would shut down siblings that
+    # are still running.
+    |> Enum.to_list()
+    |> Enum.reduce_while(state, fn {:ok, {step, outcome}}, acc ->
+      case apply_step_outcome(acc, step, outcome) do
+        {:ok, updated} -> {:cont, updated}
+        {:error, failed_state, failure} -> {:halt, {:error, failed_state, failure}}
+      end
+    end)
+    |> case do
+      {:error, failed_state, failure} -> {:error, failed_state, failure}
+      updated_state -> {:ok, updated_state}
+    end
+  end
+
   defp execute_ready_steps(state, ready_steps) do
     Enum.reduce_while(ready_steps, state, fn step, acc ->
       case execute_step(step, acc) do
@@ -104,10 +156,15 @@ defmodule Synapse.Workflow.Engine do
   end
 
   defp execute_step(%Step{} = step, state) do
-    do_execute_step(step, state, 1)
+    apply_step_outcome(state, step, run_step(step, state, 1))
   end
 
-  defp do_execute_step(step, state, attempt) do
+  # Runs a step (including retries) without touching the workflow state so the
+  # same code path can be used from concurrently executing tasks. Exceptions
+  # raised while setting a step up, such as from a params function, fail the
+  # step rather than escaping, so they surface the same way whether or not the
+  # step runs in a task linked to the caller.
+  defp run_step(step, state, attempt) do
     env = build_env(state, step)
     params = resolve_params(step, env)
     telemetry_meta = telemetry_metadata(state, step, attempt)
@@ -121,41 +178,51 @@ defmodule Synapse.Workflow.Engine do
     )
 
     exec_context = build_exec_context(state, step, attempt)
+    result = Exec.run(step.action, params, exec_context)
+
+    duration = System.monotonic_time(:microsecond) - start_monotonic
+
+    timing = %{
+      attempt: attempt,
+      duration: duration,
+      started_at: start_dt,
+      finished_at: DateTime.utc_now()
+    }
 
-    case Exec.run(step.action, params, exec_context) do
+    case result do
       {:ok, result} ->
-        handle_step_success(
-          state,
-          step,
-          result,
-          attempt,
-          start_dt,
-          start_monotonic,
+        :telemetry.execute(
+          [:synapse, :workflow, :step, :stop],
+          %{duration_us: duration, attempt: attempt},
           telemetry_meta
         )
 
+        {:ok, result, timing}
+
       {:error, error} ->
-        handle_step_error(state, step, attempt, start_dt, start_monotonic, telemetry_meta, error)
+        :telemetry.execute(
+          [:synapse, :workflow, :step, :exception],
+          %{duration_us: duration, attempt: attempt},
+          Map.put(telemetry_meta, :error, error)
+        )
+
+        max_attempts = Map.get(step.retry, :max_attempts, 1)
+
+        if attempt < max_attempts do
+          run_step(step, state, attempt + 1)
+        else
+          {:error, error, timing}
+        end
     end
+  rescue
+    exception ->
+      now = DateTime.utc_now()
+      {:error, exception, %{attempt: attempt, duration: 0, started_at: now, finished_at: now}}
   end
 
-  defp handle_step_success(
-         state,
-         step,
-         result,
-         attempt,
-         start_dt,
-         start_monotonic,
-         telemetry_meta
-       ) do
-    duration = System.monotonic_time(:microsecond) - start_monotonic
-    finish_dt = DateTime.utc_now()
-
-    :telemetry.execute(
-      [:synapse, :workflow, :step, :stop],
-      %{duration_us: duration, attempt: attempt},
-      telemetry_meta
-    )
+  defp apply_step_outcome(state, step, {:ok, result, timing}) do
+    %{attempt: attempt, duration: duration, started_at: start_dt, finished_at: finish_dt} =
+      timing
 
     updated_state =
       record_success(state, step, result, attempt, duration, start_dt, finish_dt)
@@ -165,23 +232,11 @@ defmodule Synapse.Workflow.Engine do
     {:ok, updated_state}
   end
 
-  defp handle_step_error(state, step, attempt, start_dt, start_monotonic, telemetry_meta, error) do
-    duration = System.monotonic_time(:microsecond) - start_monotonic
-    finish_dt = DateTime.utc_now()
-
-    :telemetry.execute(
-      [:synapse, :workflow, :step, :exception],
-      %{duration_us: duration, attempt: attempt},
-      Map.put(telemetry_meta, :error, error)
-    )
+  defp apply_step_outcome(state, step, {:error, error, timing}) do
+    %{attempt: attempt, duration: duration, started_at: start_dt, finished_at: finish_dt} =
+      timing
 
-    max_attempts = Map.get(step.retry, :max_attempts, 1)
-
-    if attempt < max_attempts do
-      do_execute_step(step, state, attempt + 1)
-    else
-      finalize_step_failure(state, step, attempt, duration, start_dt, finish_dt, error)
-    end
+    finalize_step_failure(state, step, attempt, duration, start_dt, finish_dt, error)
   end
 
   defp finalize_step_failure(state, step, attempt, duration, start_dt, finish_dt, error) do
@@ -281,12 +336,10 @@ defmodule Synapse.Workflow.Engine do
         finished_at: finished_at
       )
 
-    %{
-      state
-      | results: Map.put(state.results, step.id, result),
-        completed: MapSet.put(state.completed, step.id),
-        audit_steps: [audit_entry | state.audit_steps]
-    }
+    state
+    |> put_step_result(step.id, result)
+    |> mark_step_completed(step.id)
+    |> Map.update!(:audit_steps, &[audit_entry | &1])
   end
 
   defp record_failure(state, step, attempt, duration, started_at, finished_at, error) do
@@ -303,10 +356,19 @@ defmodule Synapse.Workflow.Engine do
     %{state | audit_steps: [audit_entry | state.audit_steps]}
   end
 
-  defp put_step_result(state, step_id, value) do
+  defp put_step_result(%{snapshot_parts: nil} = state, step_id, value) do
     %{state | results: Map.put(state.results, step_id, value)}
   end
 
+  defp put_step_result(state, step_id, value) do
+    parts = %{
+      state.snapshot_parts
+      | results: Map.put(state.snapshot_parts.results, step_id, sanitize_value(value))
+    }
+
+    %{state | results: Map.put(state.results, step_id, value), snapshot_parts: parts}
+  end
+
   defp mark_step_completed(state, step_id) do
     %{state | completed: MapSet.put(state.completed, step_id)}
   end
@@ -356,7 +418,7 @@ defmodule Synapse.Workflow.Engine do
       status: status,
       started_at: state.started_at,
       finished_at: DateTime.utc_now(),
-      steps: state.audit_steps |> Enum.reverse() |> Enum.map(&sanitize_audit_step/1)
+      steps: Enum.reverse(state.audit_steps)
     }
   end
 
@@ -420,17 +482,14 @@ defmodule Synapse.Workflow.Engine do
   defp persist_state(state, status, attrs) do
     {module, options} = state.persistence
 
-    snapshot =
-      state
-      |> build_snapshot(status, attrs)
-      |> sanitize_snapshot()
+    snapshot = build_snapshot(state, status, attrs)
 
     case module.upsert_snapshot(snapshot, options) do
       :ok ->
         :ok
 
       {:error, reason} ->
-        Logger.error("workflow snapshot persistence failed #{inspect(reason)}",
+        Logger.error("Workflow snapshot persistence failed",
           request_id: state.request_id,
           workflow: state.spec.name,
           status: status,
@@ -441,22 +500,31 @@ defmodule Synapse.Workflow.Engine do
     end
   end
 
+  # Input, context, and step results are sanitized once as they enter the
+  # state (see snapshot_parts) instead of re-walking every earlier result each
+  # time a snapshot is persisted.
   defp build_snapshot(state, status, attrs) do
     %Snapshot{
       request_id: state.request_id,
       spec_name: to_string(state.spec.name),
       spec_version: state.spec_version || 1,
       status: status,
-      input: state.input,
-      context: state.context,
-      results: state.results,
-      audit_trail: wrap_audit_trail(state, status),
+      input: state.snapshot_parts.input,
+      context: state.snapshot_parts.context,
+      results: state.snapshot_parts.results,
+      audit_trail: state |> wrap_audit_trail(status) |> sanitize_value(),
       last_step_id: attrs |> Map.get(:last_step_id) |> normalize_step_id(),
       last_attempt: Map.get(attrs, :last_attempt),
-      error: Map.get(attrs, :error)
+      error: attrs |> Map.get(:error) |> sanitize_value()
     }
   end
 
+  defp init_snapshot_parts(nil, _input, _context), do: nil
+
+  defp init_snapshot_parts(_persistence, input, context) do
+    %{input: sanitize_value(input), context: sanitize_value(context), results: %{}}
+  end
+
   defp normalize_step_id(nil), do: nil
   defp normalize_step_id(value) when is_atom(value), do: Atom.to_string(value)
   defp normalize_step_id(value), do: value
@@ -471,22 +539,6 @@ defmodule Synapse.Workflow.Engine do
   defp maybe_format_audit_error(error) when is_struct(error), do: serialize_error(error)
   defp maybe_format_audit_error(error), do: error
 
-  defp sanitize_audit_step(entry) do
-    Map.update(entry, :error, nil, fn
-      nil -> nil
-      error when is_struct(error) -> serialize_error(error)
-      error -> error
-    end)
-  end
-
-  defp sanitize_snapshot(%Snapshot{} = snapshot) do
-    snapshot
-    |> Map.from_struct()
-    |> Enum.map(fn {key, value} -> {key, sanitize_value(value)} end)
-    |> Enum.into(%{})
-    |> then(&struct(Snapshot, &1))
-  end
-
   defp sanitize_value(%DateTime{} = value), do: value
   defp sanitize_value(%NaiveDateTime{} = value), do: value
 
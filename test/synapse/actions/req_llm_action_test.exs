@@ -127,6 +127,36 @@ defmodule Synapse.Actions.ReqLLMActionTest do
     assert result.metadata.provider_id == "resp-123"
   end
 
+  test "picks up configuration changes between requests", %{openai_stub: stub} do
+    response = fn conn ->
+      Req.Test.json(conn, %{
+        choices: [%{"message" => %{"content" => "ok"}}],
+        usage: %{"total_tokens" => 1}
+      })
+    end
+
+    Req.Test.expect(stub, fn conn ->
+      assert Plug.Conn.get_req_header(conn, "authorization") == ["Bearer test-key"]
+      response.(conn)
+    end)
+
+    assert {:ok, _} = legacy_chat_completion(%{prompt: "first", messages: []})
+
+    config = Application.get_env(:synapse, Synapse.ReqLLM)
+
+    profiles =
+      Map.update!(config[:profiles], :openai, &Keyword.put(&1, :api_key, "rotated-key"))
+
+    Application.put_env(:synapse, Synapse.ReqLLM, Keyword.put(config, :profiles, profiles))
+
+    Req.Test.expect(stub, fn conn ->
+      assert Plug.Conn.get_req_header(conn, "authorization") == ["Bearer rotated-key"]
+      response.(conn)
+    end)
+
+    assert {:ok, _} = legacy_chat_completion(%{prompt: "second", messages: []})
+  end
+
   test "supports switching profiles", %{gemini_stub: stub} do
     Req.Test.expect(stub, fn conn ->
       {:ok, body, conn} = Plug.Conn.read_body(conn)
@@ -221,6 +251,23 @@ defmodule Synapse.Actions.ReqLLMActionTest do
     end
   end
 
+  test "rejects prompts larger than max_prompt_bytes before sending", _context do
+    config = Application.get_env(:synapse, Synapse.ReqLLM)
+
+    profiles =
+      Map.update!(config[:profiles], :openai, &Keyword.put(&1, :max_prompt_bytes, 16))
+
+    Application.put_env(:synapse, Synapse.ReqLLM, Keyword.put(config, :profiles, profiles))
+
+    assert {:error, error} =
+             legacy_chat_completion(%{
+               prompt: "short",
+               messages: [%{role: "user", content: String.duplicate("x", 32)}]
+             })
+
+    assert error.message =~ "exceeding max_prompt_bytes 16"
+  end
+
   test "validates retry configuration", _context do
     original = Application.get_env(:synapse, Synapse.ReqLLM)
 
@@ -340,6 +387,199 @@ defmodule Synapse.Actions.ReqLLMActionTest do
     end
   end
 
+  test "fails requests that wait longer than queue_timeout_ms for a slot", %{
+    openai_stub: stub,
+    test: test
+  } do
+    # Limiter slots are keyed by profile name, so use one unique to this test.
+    profile = String.to_atom("limited_#{test}")
+
+    Application.put_env(:synapse, Synapse.ReqLLM,
+      default_profile: profile,
+      profiles: %{
+        profile => [
+          base_url: "https://llm.test",
+          api_key: "test-key",
+          model: "gpt-5-nano",
+          retry: [enabled: false],
+          concurrency: [max_in_flight: 1, queue_timeout_ms: 50],
+          plug: {Req.Test, stub},
+          plug_owner: self()
+        ]
+      }
+    )
+
+    test_pid = self()
+
+    Req.Test.stub(stub, fn conn ->
+      send(test_pid, {:in_flight, self()})
+
+      receive do
+        :release -> Req.Test.json(conn, %{choices: [%{"message" => %{"content" => "done"}}]})
+      end
+    end)
+
+    first = Task.async(fn -> legacy_chat_completion(%{prompt: "first"}, profile: profile) end)
+    assert_receive {:in_flight, holder}, 1_000
+
+    assert {:error, error} = legacy_chat_completion(%{prompt: "second"}, profile: profile)
+    assert error.details[:reason] == :concurrency_limit
+    refute_received {:in_flight, _pid}
+
+    send(holder, :release)
+    assert {:ok, %{content: "done"}} = Task.await(first)
+  end
+
+  test "fails fast once the profile's circuit breaker opens", %{openai_stub: stub, test: test} do
+    # Breaker state is keyed by profile name, so use one unique to this test.
+    profile = String.to_atom("breaker_#{test}")
+
+    Application.put_env(:synapse, Synapse.ReqLLM,
+      default_profile: profile,
+      profiles: %{
+        profile => [
+          base_url: "https://llm.test",
+          api_key: "test-key",
+          model: "gpt-5-nano",
+          retry: [enabled: false],
+          circuit_breaker: [failure_threshold: 2, cooldown_ms: 60_000],
+          plug: {Req.Test, stub},
+          plug_owner: self()
+        ]
+      }
+    )
+
+    test_pid = self()
+
+    Req.Test.stub(stub, fn conn ->
+      send(test_pid, :attempt)
+
+      conn
+      |> Plug.Conn.put_status(503)
+      |> Req.Test.json(%{"error" => %{"message" => "Overloaded"}})
+    end)
+
+    for _ <- 1..2 do
+      assert {:error, error} = legacy_chat_completion(%{prompt: "hi"}, profile: profile)
+      assert error.details[:status] == 503
+      assert_received :attempt
+    end
+
+    # Outcomes are recorded asynchronously.
+    _ = :sys.get_state(ReqLLM.CircuitBreaker)
+
+    assert {:error, error} = legacy_chat_completion(%{prompt: "hi"}, profile: profile)
+    assert error.details[:reason] == :circuit_open
+    refute_received :attempt
+  end
+
+  test "client errors between server errors do not reset the circuit breaker", %{
+    openai_stub: stub,
+    test: test
+  } do
+    profile = String.to_atom("breaker_#{test}")
+
+    Application.put_env(:synapse, Synapse.ReqLLM,
+      default_profile: profile,
+      profiles: %{
+        profile => [
+          base_url: "https://llm.test",
+          api_key: "test-key",
+          model: "gpt-5-nano",
+          retry: [enabled: false],
+          circuit_breaker: [failure_threshold: 2, cooldown_ms: 60_000],
+          plug: {Req.Test, stub},
+          plug_owner: self()
+        ]
+      }
+    )
+
+    for status <- [503, 400, 503] do
+      Req.Test.expect(stub, fn conn ->
+        conn
+        |> Plug.Conn.put_status(status)
+        |> Req.Test.json(%{"error" => %{"message" => "status #{status}"}})
+      end)
+
+      assert {:error, error} = legacy_chat_completion(%{prompt: "hi"}, profile: profile)
+      assert error.details[:status] == status
+      _ = :sys.get_state(ReqLLM.CircuitBreaker)
+    end
+
+    assert {:error, error} = legacy_chat_completion(%{prompt: "hi"}, profile: profile)
+    assert error.details[:reason] == :circuit_open
+  end
+
+  test "serves repeated deterministic requests from the response cache", %{
+    openai_stub: stub,
+    test: test
+  } do
+    # The cache is shared, so key entries by a profile unique to this test.
+    profile = String.to_atom("cached_#{test}")
+    put_cached_profile_config(profile, stub, system_prompt: "Be brief")
+
+    test_pid = self()
+    handler_id = "req-llm-cache-#{test}"
+
+    :telemetry.attach(
+      handler_id,
+      [:synapse, :llm, :request, :stop],
+      fn
+        _event, _measurements, %{profile: ^profile} = metadata, _config ->
+          send(test_pid, {:stop, metadata})
+
+        _event, _measurements, _metadata, _config ->
+          :ok
+      end,
+      nil
+    )
+
+    on_exit(fn -> :telemetry.detach(handler_id) end)
+
+    Req.Test.stub(stub, fn conn ->
+      send(test_pid, :attempt)
+
+      Req.Test.json(conn, %{
+        choices: [%{"message" => %{"content" => "cached answer"}}],
+        usage: %{"total_tokens" => 7}
+      })
+    end)
+
+    for _ <- 1..2 do
+      assert {:ok, %{content: "cached answer"}} =
+               legacy_chat_completion(%{prompt: "hi"}, profile: profile, temperature: 0)
+    end
+
+    assert_received :attempt
+    refute_received :attempt
+
+    assert_received {:stop, %{cached: false, token_usage: %{total_tokens: 7}}}
+    assert_received {:stop, %{cached: true, token_usage: nil}}
+
+    # A different system prompt changes the request, so it is not served stale.
+    put_cached_profile_config(profile, stub, system_prompt: "Be thorough")
+    assert {:ok, _} = legacy_chat_completion(%{prompt: "hi"}, profile: profile, temperature: 0)
+    assert_received :attempt
+  end
+
+  test "does not cache requests that sample", %{openai_stub: stub, test: test} do
+    profile = String.to_atom("cached_#{test}")
+    put_cached_profile_config(profile, stub, [])
+
+    test_pid = self()
+
+    Req.Test.stub(stub, fn conn ->
+      send(test_pid, :attempt)
+      Req.Test.json(conn, %{choices: [%{"message" => %{"content" => "sampled"}}]})
+    end)
+
+    # No temperature means the provider default, which samples.
+    for opts <- [[], [temperature: 0.7]], _ <- 1..2 do
+      assert {:ok, _} = legacy_chat_completion(%{prompt: "hi"}, [profile: profile] ++ opts)
+      assert_received :attempt
+    end
+  end
+
   test "surfaces authentication failures from provider", %{openai_stub: stub} do
     Req.Test.expect(stub, fn conn ->
       conn
@@ -393,6 +633,233 @@ defmodule Synapse.Actions.ReqLLMActionTest do
       )
   end
 
+  describe "stream_chat_completion/3" do
+    test "delivers deltas to the callback and returns the full completion", %{
+      openai_stub: stub
+    } do
+      Req.Test.expect(stub, fn conn ->
+        {:ok, body, conn} = Plug.Conn.read_body(conn)
+        json = Jason.decode!(body)
+
+        assert json["stream"] == true
+        assert json["stream_options"] == %{"include_usage" => true}
+
+        events =
+          [
+            %{"id" => "chatcmpl-1", "choices" => [%{"delta" => %{"role" => "assistant"}}]},
+            %{"id" => "chatcmpl-1", "choices" => [%{"delta" => %{"content" => "Hello"}}]},
+            %{
+              "id" => "chatcmpl-1",
+              "choices" => [%{"delta" => %{"content" => " world"}, "finish_reason" => "stop"}]
+            },
+            %{"id" => "chatcmpl-1", "choices" => [], "usage" => %{"total_tokens" => 12}}
+          ]
+          |> Enum.map_join(&"data: #{Jason.encode!(&1)}\n\n")
+
+        conn
+        |> Plug.Conn.put_resp_content_type("text/event-stream")
+        |> Plug.Conn.send_resp(200, events <> "data: [DONE]\n\n")
+      end)
+
+      test_pid = self()
+
+      assert {:ok, %{content: "Hello world", metadata: metadata}} =
+               ReqLLM.stream_chat_completion(
+                 %{prompt: "hi", messages: []},
+                 &send(test_pid, {:delta, &1}),
+                 profile: :openai
+               )
+
+      assert_received {:delta, "Hello"}
+      assert_received {:delta, " world"}
+      refute_received {:delta, _}
+      assert metadata.finish_reason == "stop"
+      assert metadata.total_tokens == 12
+      assert metadata.provider == :openai
+    end
+
+    test "coalesces deltas up to :coalesce_bytes before invoking the callback", %{
+      openai_stub: stub
+    } do
+      Req.Test.expect(stub, fn conn ->
+        events =
+          ["Hel", "lo ", "wor", "ld"]
+          |> Enum.map_join(fn delta ->
+            "data: #{Jason.encode!(%{"choices" => [%{"delta" => %{"content" => delta}}]})}\n\n"
+          end)
+
+        conn
+        |> Plug.Conn.put_resp_content_type("text/event-stream")
+        |> Plug.Conn.send_resp(200, events <> "data: [DONE]\n\n")
+      end)
+
+      test_pid = self()
+
+      assert {:ok, %{content: "Hello world"}} =
+               ReqLLM.stream_chat_completion(
+                 %{prompt: "hi", messages: []},
+                 &send(test_pid, {:delta, &1}),
+                 profile: :openai,
+                 coalesce_bytes: 8
+               )
+
+      assert_received {:delta, "Hello wor"}
+      assert_received {:delta, "ld"}
+      refute_received {:delta, _}
+    end
+
+    test "holds deltas for :coalesce_ms and flushes them when the stream ends", %{
+      openai_stub: stub
+    } do
+      Req.Test.expect(stub, fn conn ->
+        events =
+          ["Hel", "lo ", "wor", "ld"]
+          |> Enum.map_join(fn delta ->
+            "data: #{Jason.encode!(%{"choices" => [%{"delta" => %{"content" => delta}}]})}\n\n"
+          end)
+
+        conn
+        |> Plug.Conn.put_resp_content_type("text/event-stream")
+        |> Plug.Conn.send_resp(200, events <> "data: [DONE]\n\n")
+      end)
+
+      test_pid = self()
+
+      assert {:ok, %{content: "Hello world"}} =
+               ReqLLM.stream_chat_completion(
+                 %{prompt: "hi", messages: []},
+                 &send(test_pid, {:delta, &1}),
+                 profile: :openai,
+                 coalesce_ms: 60_000
+               )
+
+      assert_received {:delta, "Hello world"}
+      refute_received {:delta, _}
+    end
+
+    test "translates error responses like chat completions", %{openai_stub: stub} do
+      Req.Test.expect(stub, fn conn ->
+        conn
+        |> Plug.Conn.put_status(401)
+        |> Req.Test.json(%{"error" => %{"message" => "Incorrect API key provided"}})
+      end)
+
+      assert {:error, error} =
+               ReqLLM.stream_chat_completion(%{prompt: "hi", messages: []}, fn _ -> :ok end,
+                 profile: :openai
+               )
+
+      assert error.message =~ "unauthorized"
+      assert error.details[:status] == 401
+    end
+
+    test "rejects providers without streaming support", _context do
+      assert {:error, error} =
+               ReqLLM.stream_chat_completion(%{prompt: "hi", messages: []}, fn _ -> :ok end,
+                 profile: :gemini
+               )
+
+      assert error.message =~ "does not support streaming"
+    end
+  end
+
+  describe "batch_chat_completion/2" do
+    test "returns results in request order and isolates failures", %{openai_stub: stub} do
+      Req.Test.stub(stub, fn conn ->
+        {:ok, body, conn} = Plug.Conn.read_body(conn)
+        %{"content" => prompt} = body |> Jason.decode!() |> Map.fetch!("messages") |> List.last()
+
+        if prompt == "fail" do
+          conn
+          |> Plug.Conn.put_status(401)
+          |> Req.Test.json(%{"error" => %{"message" => "bad key"}})
+        else
+          Req.Test.json(conn, %{choices: [%{"message" => %{"content" => "echo " <> prompt}}]})
+        end
+      end)
+
+      assert [{:ok, first}, {:error, error}, {:ok, last}] =
+               ReqLLM.batch_chat_completion(
+                 [%{prompt: "one"}, %{prompt: "fail"}, %{prompt: "three"}],
+                 profile: :openai,
+                 max_concurrency: 2
+               )
+
+      assert first.content == "echo one"
+      assert last.content == "echo three"
+      assert error.message =~ "unauthorized"
+    end
+
+    test "passes :timeout through to each request and bounds entries by :batch_timeout", %{
+      openai_stub: stub
+    } do
+      test_pid = self()
+
+      # Req.Test plugs never see Req options, so this profile swaps in an
+      # adapter that reports the receive_timeout Req was given.
+      adapter = fn request ->
+        send(test_pid, {:receive_timeout, request.options[:receive_timeout]})
+        Process.sleep(50)
+        body = Jason.encode!(%{choices: [%{"message" => %{"content" => "slow"}}]})
+
+        {request,
+         Req.Response.new(
+           status: 200,
+           headers: %{"content-type" => ["application/json"]},
+           body: body
+         )}
+      end
+
+      config = Application.get_env(:synapse, Synapse.ReqLLM)
+
+      profiles =
+        Map.put(config[:profiles], :adapter,
+          base_url: "https://llm.test",
+          api_key: "test-key",
+          model: "gpt-5-nano",
+          retry: [enabled: false],
+          req_options: [adapter: adapter]
+        )
+
+      Application.put_env(:synapse, Synapse.ReqLLM, Keyword.put(config, :profiles, profiles))
+
+      # :timeout is the per-request HTTP timeout, not a limit on the batch entry.
+      assert [{:ok, %{content: "slow"}}] =
+               ReqLLM.batch_chat_completion([%{prompt: "one"}], profile: :adapter, timeout: 10)
+
+      assert_received {:receive_timeout, 10}
+
+      Req.Test.stub(stub, fn conn ->
+        Process.sleep(50)
+        Req.Test.json(conn, %{choices: [%{"message" => %{"content" => "slow"}}]})
+      end)
+
+      assert [{:error, error}] =
+               ReqLLM.batch_chat_completion([%{prompt: "one"}],
+                 profile: :openai,
+                 batch_timeout: 10
+               )
+
+      assert error.message =~ "did not complete"
+      assert error.details[:reason] == :timeout
+    end
+
+    test "returns an error in the slot of an entry that raises", %{openai_stub: stub} do
+      Req.Test.stub(stub, fn conn ->
+        Req.Test.json(conn, %{choices: [%{"message" => %{"content" => "ok"}}]})
+      end)
+
+      assert [{:ok, %{content: "ok"}}, {:error, error}] =
+               ReqLLM.batch_chat_completion(
+                 [%{prompt: "one"}, %{messages: [%{role: :user}]}],
+                 profile: :openai
+               )
+
+      assert error.message =~ "did not complete"
+      assert error.details[:reason] =~ "message must include"
+    end
+  end
+
   describe "system prompt precedence" do
     test "profile-level system prompt overrides global", %{openai_stub: stub} do
       original = Application.get_env(:synapse, Synapse.ReqLLM)
@@ -500,6 +967,26 @@ defmodule Synapse.Actions.ReqLLMActionTest do
     end
   end
 
+  defp put_cached_profile_config(profile, stub, global) do
+    Application.put_env(
+      :synapse,
+      Synapse.ReqLLM,
+      [
+        default_profile: profile,
+        profiles: %{
+          profile => [
+            base_url: "https://llm.test",
+            api_key: "test-key",
+            model: "gpt-5-nano",
+            response_cache: [ttl_ms: 60_000],
+            plug: {Req.Test, stub},
+            plug_owner: self()
+          ]
+        }
+      ] ++ global
+    )
+  end
+
   defp legacy_chat_completion(params, opts \\ []) do
     ReqLLM.legacy_chat_completion(params, opts)
   end
@@ -0,0 +1,41 @@
+defmodule Synapse.AgentRegistryTest do
+  use ExUnit.Case, async: true
+
+  alias Synapse.AgentRegistry
+
+  setup do
+    registry = start_supervised!({AgentRegistry, name: nil})
+    %{registry: registry}
+  end
+
+  test "unregister releases the monitor for the agent", %{registry: registry} do
+    old_pid = spawn(fn -> Process.sleep(:infinity) end)
+    new_pid = spawn(fn -> Process.sleep(:infinity) end)
+
+    assert :ok = AgentRegistry.register(registry, "worker", old_pid)
+    assert :ok = AgentRegistry.unregister(registry, "worker")
+    assert :ok = AgentRegistry.register(registry, "worker", new_pid)
+
+    ref = Process.monitor(old_pid)
+    Process.exit(old_pid, :kill)
+    assert_receive {:DOWN, ^ref, :process, ^old_pid, :killed}
+
+    assert {:ok, ^new_pid} = AgentRegistry.lookup(registry, "worker")
+    assert %{monitors: monitors} = :sys.get_state(registry)
+    assert map_size(monitors) == 1
+  end
+
+  test "named registries serve lookups from their ETS mirror" do
+    name = :"agent_registry_test_#{System.unique_integer([:positive])}"
+    start_supervised!({AgentRegistry, name: name}, id: name)
+    pid = spawn(fn -> Process.sleep(:infinity) end)
+
+    assert {:error, :not_found} = AgentRegistry.lookup(name, "worker")
+    assert :ok = AgentRegistry.register(name, "worker", pid)
+    assert [{"worker", ^pid}] = :ets.lookup(name, "worker")
+    assert {:ok, ^pid} = AgentRegistry.lookup(name, "worker")
+
+    assert :ok = AgentRegistry.unregister(name, "worker")
+    assert {:error, :not_found} = AgentRegistry.lookup(name, "worker")
+  end
+end
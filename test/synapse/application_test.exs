@@ -49,6 +49,11 @@ defmodule Synapse.ApplicationTest do
     test "starts AgentRegistry", %{runtime: runtime} do
       assert Process.whereis(runtime.registry)
     end
+
+    test "reports the runtime as healthy", %{runtime: runtime} do
+      assert Synapse.Runtime.healthy?(runtime.name)
+      refute Synapse.Runtime.healthy?(:"missing_runtime_#{System.unique_integer([:positive])}")
+    end
   end
 
   defp fetch_default_runtime do
@@ -15,6 +15,7 @@ defmodule Synapse.Orchestrator.AgentConfigTest do
       assert {:ok, %AgentConfig{} = result} = AgentConfig.new(config)
       assert result.id == :demo_agent
       assert result.actions == [Sample.Action]
+      assert result.max_concurrency == 1
     end
 
     test "errors when specialist is missing actions" do
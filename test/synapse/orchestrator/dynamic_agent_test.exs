@@ -0,0 +1,100 @@
+defmodule Synapse.Orchestrator.DynamicAgentTest do
+  use ExUnit.Case, async: true
+
+  @moduletag :capture_log
+
+  alias Jido.Signal
+  alias Synapse.Orchestrator.{AgentConfig, DynamicAgent}
+
+  describe "max_concurrency" do
+    setup do
+      %{agent: start_agent(2)}
+    end
+
+    test "processes up to max_concurrency signals at once and queues the rest in order", %{
+      agent: agent
+    } do
+      Enum.each(1..5, &send_signal(agent, &1))
+
+      first = await_started(1)
+      second = await_started(2)
+      refute_receive {:started, _id, _pids}, 50
+
+      release(first)
+      third = await_started(3)
+      refute_receive {:started, _id, _pids}, 50
+
+      release(second)
+      fourth = await_started(4)
+
+      release(third)
+      fifth = await_started(5)
+
+      Enum.each([fourth, fifth], &release/1)
+      refute_receive {:started, _id, _pids}, 50
+    end
+
+    test "a crashed task frees its slot so queued signals keep draining", %{agent: agent} do
+      Enum.each(1..3, &send_signal(agent, &1))
+
+      first = await_started(1)
+      second = await_started(2)
+      refute_receive {:started, _id, _pids}, 50
+
+      # Kill the agent's own task for the first signal, not just the action.
+      [task] = Enum.filter(first, &(&1 in agent_tasks(agent)))
+      Process.exit(task, :kill)
+
+      third = await_started(3)
+      Enum.each([second, third], &release/1)
+      assert Process.alive?(agent)
+    end
+  end
+
+  defp start_agent(max_concurrency) do
+    config = %AgentConfig{
+      id: :"dynamic_agent_#{System.unique_integer([:positive])}",
+      type: :specialist,
+      actions: [],
+      signals: %{subscribes: [], emits: []},
+      max_concurrency: max_concurrency,
+      # With no actions the result builder is the only work an agent task does,
+      # so it stands in for a slow action: it reports the processes it runs
+      # under and waits to be released.
+      result_builder: fn _results, %{id: id, test_pid: test_pid} ->
+        send(test_pid, {:started, id, [self() | Process.get(:"$callers", [])]})
+
+        receive do
+          :release -> %{id: id}
+        after
+          5_000 -> %{id: id}
+        end
+      end
+    }
+
+    start_supervised!({DynamicAgent, config: config, router: nil})
+  end
+
+  defp send_signal(agent, id) do
+    signal = Signal.new!(%{type: "synapse.test.dynamic_agent", data: %{id: id, test_pid: self()}})
+    send(agent, {:signal, signal})
+  end
+
+  defp await_started(id) do
+    assert_receive {:started, ^id, pids}, 1_000
+    pids
+  end
+
+  defp release([worker | _callers]), do: send(worker, :release)
+
+  defp agent_tasks(agent) do
+    {:links, links} = Process.info(agent, :links)
+
+    Enum.filter(links, fn pid ->
+      case is_pid(pid) && Process.info(pid, :dictionary) do
+        {:dictionary, dictionary} -> agent in Keyword.get(dictionary, :"$callers", [])
+        _ -> false
+      end
+    end)
+  end
+end
@@ -72,6 +72,54 @@ defmodule Synapse.Orchestrator.RuntimeTest do
     assert eventually(fn -> Runtime.list_agents(runtime) == [] end)
   end
 
+  test "re-evaluates the config file when it changes on disk", %{
+    config_path: path,
+    router: router
+  } do
+    write_config(path, [
+      %{
+        id: :file_watch_agent,
+        type: :specialist,
+        actions: [Runtime.Action],
+        signals: canonical_signals()
+      }
+    ])
+
+    runtime =
+      start_supervised!({Runtime, config_source: path, reconcile_interval: 50, router: router})
+
+    assert eventually(fn -> Runtime.list_agents(runtime) |> Enum.count() == 1 end)
+
+    write_config(path, [])
+
+    assert eventually(fn -> Runtime.list_agents(runtime) == [] end)
+  end
+
+  test "picks up same-size edits that keep the file's modification time", %{
+    config_path: path,
+    router: router
+  } do
+    write_config(path, [
+      %{id: :agent_a, type: :specialist, actions: [Runtime.Action], signals: canonical_signals()}
+    ])
+
+    %File.Stat{mtime: mtime} = File.stat!(path, time: :posix)
+
+    runtime =
+      start_supervised!({Runtime, config_source: path, reconcile_interval: 50, router: router})
+
+    agent_ids = fn -> runtime |> Runtime.list_agents() |> Enum.map(& &1.agent_id) end
+    assert eventually(fn -> agent_ids.() == [:agent_a] end)
+
+    write_config(path, [
+      %{id: :agent_b, type: :specialist, actions: [Runtime.Action], signals: canonical_signals()}
+    ])
+
+    File.touch!(path, mtime)
+
+    assert eventually(fn -> agent_ids.() == [:agent_b] end)
+  end
+
   test "get_agent_config returns config for existing agent", %{config_path: path, router: router} do
     write_config(path, [
       %{
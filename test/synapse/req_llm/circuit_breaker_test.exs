@@ -0,0 +1,113 @@
+defmodule Synapse.ReqLLM.CircuitBreakerTest do
+  use ExUnit.Case, async: true
+
+  alias Synapse.ReqLLM.CircuitBreaker
+
+  @config [failure_threshold: 2, cooldown_ms: 30]
+
+  setup do
+    name = :"circuit_breaker_test_#{System.unique_integer([:positive])}"
+    start_supervised!({CircuitBreaker, name: name})
+    %{breaker: name}
+  end
+
+  test "opens after consecutive failures", %{breaker: breaker} do
+    record(breaker, :openai, :failure)
+    record(breaker, :openai, :success)
+    record(breaker, :openai, :failure)
+    assert :ok = CircuitBreaker.allow(breaker, :openai)
+
+    record(breaker, :openai, :failure)
+    assert {:error, :open} = CircuitBreaker.allow(breaker, :openai)
+    assert :ok = CircuitBreaker.allow(breaker, :gemini)
+  end
+
+  test "lets a single probe through after the cooldown", %{breaker: breaker} do
+    open_circuit(breaker, :openai)
+    Process.sleep(40)
+
+    assert :ok = CircuitBreaker.allow(breaker, :openai)
+    other_caller = Task.async(fn -> CircuitBreaker.allow(breaker, :openai) end)
+    assert {:error, :open} = Task.await(other_caller)
+
+    record(breaker, :openai, :success)
+    assert :ok = CircuitBreaker.allow(breaker, :openai)
+  end
+
+  test "reopens when the probe fails", %{breaker: breaker} do
+    open_circuit(breaker, :openai)
+    Process.sleep(40)
+
+    assert :ok = CircuitBreaker.allow(breaker, :openai)
+    record(breaker, :openai, :failure)
+    assert {:error, :open} = CircuitBreaker.allow(breaker, :openai)
+  end
+
+  test "neutral outcomes leave the failure count unchanged", %{breaker: breaker} do
+    record(breaker, :openai, :failure)
+    record(breaker, :openai, :neutral)
+    record(breaker, :openai, :failure)
+    assert {:error, :open} = CircuitBreaker.allow(breaker, :openai)
+  end
+
+  test "ignores outcomes of requests other than the probe while open", %{breaker: breaker} do
+    open_circuit(breaker, :openai)
+
+    # A request that was already in flight when the circuit opened.
+    record_from_another_process(breaker, :openai, :success)
+    assert {:error, :open} = CircuitBreaker.allow(breaker, :openai)
+
+    Process.sleep(40)
+    assert :ok = CircuitBreaker.allow(breaker, :openai)
+    record_from_another_process(breaker, :openai, :failure)
+
+    record(breaker, :openai, :success)
+    assert :ok = CircuitBreaker.allow(breaker, :openai)
+  end
+
+  test "hands the probe on when the prober exits without reporting", %{breaker: breaker} do
+    open_circuit(breaker, :openai)
+    Process.sleep(40)
+
+    prober = Task.async(fn -> CircuitBreaker.allow(breaker, :openai) end)
+    assert :ok = Task.await(prober)
+
+    # The prober's exit reaches the breaker asynchronously; until it does the
+    # probe is still held and callers are rejected.
+    assert eventually(fn -> CircuitBreaker.allow(breaker, :openai) == :ok end)
+  end
+
+  test "allows every request when the breaker is not running" do
+    assert :ok = CircuitBreaker.allow(:missing_circuit_breaker, :openai)
+  end
+
+  defp eventually(fun), do: eventually(fun, 100)
+
+  defp eventually(fun, 0), do: fun.()
+
+  defp eventually(fun, retries) do
+    if fun.() do
+      true
+    else
+      Process.sleep(10)
+      eventually(fun, retries - 1)
+    end
+  end
+
+  defp open_circuit(breaker, key) do
+    record(breaker, key, :failure)
+    record(breaker, key, :failure)
+    assert {:error, :open} = CircuitBreaker.allow(breaker, key)
+  end
+
+  # Outcomes are cast to the breaker; wait for them to be applied.
+  defp record(breaker, key, outcome) do
+    :ok = CircuitBreaker.record(breaker, key, outcome, @config)
+    _ = :sys.get_state(breaker)
+    :ok
+  end
+
+  defp record_from_another_process(breaker, key, outcome) do
+    Task.await(Task.async(fn -> record(breaker, key, outcome) end))
+  end
+end
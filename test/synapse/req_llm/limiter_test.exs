@@ -0,0 +1,46 @@
+defmodule Synapse.ReqLLM.LimiterTest do
+  use ExUnit.Case, async: true
+
+  alias Synapse.ReqLLM.Limiter
+
+  setup do
+    %{limiter: start_supervised!({Limiter, name: nil})}
+  end
+
+  test "rejects callers beyond the limit when the timeout is zero", %{limiter: limiter} do
+    assert {:ok, token} = Limiter.acquire(limiter, :openai, 1, 0)
+    assert {:error, :timeout} = Limiter.acquire(limiter, :openai, 1, 0)
+    assert {:ok, _other} = Limiter.acquire(limiter, :gemini, 1, 0)
+
+    :ok = Limiter.release(limiter, token)
+    assert {:ok, _token} = Limiter.acquire(limiter, :openai, 1, 0)
+  end
+
+  test "hands a released slot to the next waiter", %{limiter: limiter} do
+    assert {:ok, token} = Limiter.acquire(limiter, :openai, 1, 0)
+
+    waiter = Task.async(fn -> Limiter.acquire(limiter, :openai, 1, 1_000) end)
+
+    refute Task.yield(waiter, 50)
+    :ok = Limiter.release(limiter, token)
+
+    assert {:ok, waiter_token} = Task.await(waiter)
+    assert is_reference(waiter_token)
+  end
+
+  test "waiters time out when no slot frees up", %{limiter: limiter} do
+    assert {:ok, _token} = Limiter.acquire(limiter, :openai, 1, 0)
+    assert {:error, :timeout} = Limiter.acquire(limiter, :openai, 1, 20)
+  end
+
+  test "frees the slot of a holder that exits without releasing", %{limiter: limiter} do
+    holder =
+      Task.async(fn ->
+        {:ok, _token} = Limiter.acquire(limiter, :openai, 1, 0)
+        :held
+      end)
+
+    assert :held = Task.await(holder)
+    assert {:ok, _token} = Limiter.acquire(limiter, :openai, 1, 1_000)
+  end
+end
@@ -0,0 +1,39 @@
+defmodule Synapse.ReqLLM.ResponseCacheTest do
+  use ExUnit.Case, async: true
+
+  alias Synapse.ReqLLM.ResponseCache
+
+  setup do
+    name = :"response_cache_test_#{System.unique_integer([:positive])}"
+    start_supervised!({ResponseCache, name: name})
+    %{cache: name}
+  end
+
+  test "serves cached values until they expire", %{cache: cache} do
+    assert :error = ResponseCache.fetch(cache, {:openai, "hi"})
+
+    :ok = ResponseCache.put(cache, {:openai, "hi"}, %{content: "hello"}, ttl_ms: 30)
+    assert {:ok, %{content: "hello"}} = ResponseCache.fetch(cache, {:openai, "hi"})
+
+    Process.sleep(40)
+    assert :error = ResponseCache.fetch(cache, {:openai, "hi"})
+  end
+
+  test "stops caching at max_entries until expired entries are swept", %{cache: cache} do
+    :ok = ResponseCache.put(cache, :first, 1, ttl_ms: 20, max_entries: 1)
+    :ok = ResponseCache.put(cache, :second, 2, ttl_ms: 20, max_entries: 1)
+    assert :error = ResponseCache.fetch(cache, :second)
+
+    Process.sleep(30)
+    :ok = ResponseCache.put(cache, :second, 2, ttl_ms: 20, max_entries: 1)
+    _ = :sys.get_state(cache)
+
+    :ok = ResponseCache.put(cache, :second, 2, ttl_ms: 1_000, max_entries: 1)
+    assert {:ok, 2} = ResponseCache.fetch(cache, :second)
+  end
+
+  test "misses when the cache is not running" do
+    assert :ok = ResponseCache.put(:missing_response_cache, :key, :value, [])
+    assert :error = ResponseCache.fetch(:missing_response_cache, :key)
+  end
+end
@@ -0,0 +1,24 @@
+defmodule Synapse.ReqLLM.SSETest do
+  use ExUnit.Case, async: true
+
+  alias Synapse.ReqLLM.SSE
+
+  test "returns data only for completed events" do
+    {data, parser} = SSE.parse(SSE.new(), "data: one\n\ndata: tw")
+    assert data == ["one"]
+
+    {data, parser} = SSE.parse(parser, "o\n\n")
+    assert data == ["two"]
+    assert {[], _parser} = SSE.flush(parser)
+  end
+
+  test "joins multi-line data and ignores other fields" do
+    chunk = ": keep-alive\n\nevent: message\nid: 7\ndata: a\ndata:b\r\n\r\n"
+    assert {["a\nb"], _parser} = SSE.parse(SSE.new(), chunk)
+  end
+
+  test "flush returns a trailing event without a blank line" do
+    {[], parser} = SSE.parse(SSE.new(), "data: [DONE]")
+    assert {["[DONE]"], _parser} = SSE.flush(parser)
+  end
+end
@@ -37,6 +37,20 @@ defmodule Synapse.SignalRouterTest do
       assert received.data.id == "runtime-123"
     end
 
+    test "publish_many delivers every payload of the batch" do
+      router = RouterHelpers.start_test_router()
+
+      {:ok, _sub_id} = SignalRouter.subscribe(router, :task_request)
+
+      {:ok, signals} =
+        SignalRouter.publish_many(router, :task_request, [%{task_id: "a"}, %{task_id: "b"}])
+
+      assert Enum.map(signals, & &1.data.task_id) == ["a", "b"]
+
+      assert_receive {:signal, %{data: %{task_id: "a"}}}, 1_000
+      assert_receive {:signal, %{data: %{task_id: "b"}}}, 1_000
+    end
+
     test "subscribing to unregistered topic raises InvalidTopicError" do
       router = RouterHelpers.start_test_router()
 
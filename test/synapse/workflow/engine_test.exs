@@ -10,8 +10,10 @@ defmodule Synapse.Workflow.EngineTest do
   alias Synapse.Workflow.EngineTest.Support.{
     AddAction,
     AlwaysFailAction,
+    BarrierAction,
     FlakyAction,
-    RecordOrderAction
+    RecordOrderAction,
+    SnapshotSink
   }
 
   setup context do
@@ -196,6 +198,119 @@ defmodule Synapse.Workflow.EngineTest do
       assert Enum.find(exec.audit_trail.steps, &(&1.step == :unstable)).status == :error
       assert Enum.find(exec.audit_trail.steps, &(&1.step == :downstream)).status == :ok
     end
+
+    test "runs independent ready steps concurrently when max_concurrency > 1" do
+      test_pid = self()
+
+      spec =
+        Spec.new(
+          name: :concurrent,
+          steps: [
+            Step.new(id: :left, action: BarrierAction, params: %{test_pid: test_pid}),
+            Step.new(id: :right, action: BarrierAction, params: %{test_pid: test_pid}),
+            Step.new(
+              id: :join,
+              action: AddAction,
+              requires: [:left, :right],
+              params: fn env -> %{value: env.results.left.result + env.results.right.result} end
+            )
+          ],
+          outputs: [Spec.output(:total, from: :join)]
+        )
+
+      task = Task.async(fn -> Engine.execute(spec, persistence: nil, max_concurrency: 2) end)
+
+      assert_receive {:barrier_arrived, :left, left_pid}, 1_000
+      assert_receive {:barrier_arrived, :right, right_pid}, 1_000
+
+      send(left_pid, :release)
+      send(right_pid, :release)
+
+      assert {:ok, exec} = Task.await(task)
+      assert exec.outputs.total.result == 2
+      assert Enum.map(exec.audit_trail.steps, & &1.step) == [:left, :right, :join]
+    end
+
+    test "lets in-flight siblings finish when a concurrent step fails" do
+      test_pid = self()
+
+      spec =
+        Spec.new(
+          name: :concurrent_failure,
+          steps: [
+            Step.new(id: :explode, action: AlwaysFailAction, params: %{value: :nope}),
+            Step.new(id: :slow, action: BarrierAction, params: %{test_pid: test_pid})
+          ]
+        )
+
+      task = Task.async(fn -> Engine.execute(spec, persistence: nil, max_concurrency: 2) end)
+
+      assert_receive {:barrier_arrived, :slow, slow_pid}, 1_000
+
+      # The failure is not surfaced while the sibling is still running.
+      refute Task.yield(task, 100)
+      assert Process.alive?(slow_pid)
+
+      send(slow_pid, :release)
+
+      assert {:error, failure} = Task.await(task)
+      assert failure.failed_step == :explode
+    end
+
+    test "fails a step whose params raise the same way in concurrent and sequential mode" do
+      spec =
+        Spec.new(
+          name: :raising_params,
+          steps: [
+            Step.new(id: :add, action: AddAction, params: %{value: 1}),
+            Step.new(id: :broken, action: AddAction, params: fn _env -> raise "bad params" end)
+          ]
+        )
+
+      for max_concurrency <- [2, 1] do
+        assert {:error, failure} =
+                 Engine.execute(spec, persistence: nil, max_concurrency: max_concurrency)
+
+        assert failure.failed_step == :broken
+        assert Exception.message(failure.error) == "bad params"
+        assert failure.results.add.result == 1
+      end
+    end
+
+    test "persists sanitized snapshots for every step" do
+      spec =
+        Spec.new(
+          name: :persisted,
+          steps: [
+            Step.new(id: :add, action: AddAction, params: %{value: 1}),
+            Step.new(
+              id: :double,
+              action: AddAction,
+              requires: [:add],
+              params: fn env -> %{value: env.results.add.result * 2} end
+            )
+          ],
+          outputs: [Spec.output(:total, from: :double)]
+        )
+
+      {:ok, _exec} =
+        Engine.execute(spec,
+          input: %{range: 1..2},
+          context: %{request_id: "req-persisted", base: 0},
+          persistence: {SnapshotSink, pid: self()}
+        )
+
+      assert_received {:snapshot, %{status: :pending, results: results}}
+      assert results == %{}
+
+      assert_received {:snapshot, %{status: :running, last_step_id: "add"}}
+      assert_received {:snapshot, %{status: :running, last_step_id: "double"}}
+      assert_received {:snapshot, %{status: :completed} = snapshot}
+
+      assert snapshot.input == %{range: %{first: 1, last: 2, step: 1}}
+      assert snapshot.results == %{add: %{result: 1}, double: %{result: 2}}
+      assert Enum.map(snapshot.audit_trail.steps, & &1.step) == [:add, :double]
+    end
   end
 
   defp telemetry_events do
@@ -263,3 +378,30 @@ defmodule Synapse.Workflow.EngineTest.Support.AlwaysFailAction do
     {:error, Jido.Error.execution_error("boom")}
   end
 end
+
+defmodule Synapse.Workflow.EngineTest.Support.BarrierAction do
+  use Jido.Action,
+    name: "engine_test_barrier",
+    schema: [test_pid: [type: :any, required: true]]
+
+  @impl true
+  def run(params, context) do
+    send(params.test_pid, {:barrier_arrived, context.workflow_step, self()})
+
+    receive do
+      :release -> {:ok, %{result: 1}}
+    after
+      2_000 -> {:error, Jido.Error.execution_error("barrier was never released")}
+    end
+  end
+end
+
+defmodule Synapse.Workflow.EngineTest.Support.SnapshotSink do
+  @behaviour Synapse.Workflow.Persistence
+
+  @impl true
+  def upsert_snapshot(snapshot, opts) do
+    send(Keyword.fetch!(opts, :pid), {:snapshot, snapshot})
+    :ok
+  end
+end